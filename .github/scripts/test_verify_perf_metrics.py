@@ -0,0 +1,83 @@
+"""Tests for the perf smoke voice metrics verifier.
+
+Run with: python3 -m unittest discover -s .github/scripts
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+import verify_perf_metrics
+
+GOOD = "voice_metrics|capture_ms=1200|speech_ms=900|silence_tail_ms=300|frames_dropped=0|early_stop=vad_silence"
+
+
+class FindLatestLineTests(unittest.TestCase):
+    """Validate the backward mmap scan for the last voice_metrics line."""
+
+    def _write(self, content: bytes) -> Path:
+        handle = tempfile.NamedTemporaryFile(delete=False, suffix=".log")
+        handle.write(content)
+        handle.close()
+        self.addCleanup(Path(handle.name).unlink)
+        return Path(handle.name)
+
+    def test_returns_last_marker_line(self) -> None:
+        log = self._write(
+            b"start\n[t] voice_metrics|capture_ms=1\nnoise\n[t] voice_metrics|capture_ms=2\ntail line\n"
+        )
+
+        self.assertEqual(verify_perf_metrics.find_latest_line(log), "[t] voice_metrics|capture_ms=2")
+
+    def test_marker_on_final_line_without_newline(self) -> None:
+        log = self._write(b"first\nvoice_metrics|capture_ms=5")
+
+        self.assertEqual(verify_perf_metrics.find_latest_line(log), "voice_metrics|capture_ms=5")
+
+    def test_marker_on_first_line(self) -> None:
+        log = self._write(b"voice_metrics|capture_ms=7\nother\n")
+
+        self.assertEqual(verify_perf_metrics.find_latest_line(log), "voice_metrics|capture_ms=7")
+
+    def test_missing_marker_and_empty_file_return_none(self) -> None:
+        self.assertIsNone(verify_perf_metrics.find_latest_line(self._write(b"nothing here\n")))
+        self.assertIsNone(verify_perf_metrics.find_latest_line(self._write(b"")))
+
+    def test_invalid_utf8_is_replaced(self) -> None:
+        log = self._write(b"voice_metrics|capture_ms=1|note=\xff\n")
+
+        self.assertIn("�", verify_perf_metrics.find_latest_line(log))
+
+
+class FieldRegexTests(unittest.TestCase):
+    """Validate FIELD_RE picks out only the checked fields at `|` boundaries."""
+
+    def test_parses_checked_fields(self) -> None:
+        parts = dict(verify_perf_metrics.FIELD_RE.findall(GOOD))
+
+        self.assertEqual(
+            parts,
+            {
+                "capture_ms": "1200",
+                "speech_ms": "900",
+                "silence_tail_ms": "300",
+                "frames_dropped": "0",
+                "early_stop": "vad_silence",
+            },
+        )
+
+    def test_ignores_unchecked_and_suffix_matched_keys(self) -> None:
+        line = "voice_metrics|pre_capture_ms=5|capture_ms=10|extra=1|xspeech_ms=3"
+
+        parts = dict(verify_perf_metrics.FIELD_RE.findall(line))
+
+        self.assertEqual(parts, {"capture_ms": "10"})
+
+    def test_empty_value_is_kept(self) -> None:
+        parts = dict(verify_perf_metrics.FIELD_RE.findall("voice_metrics|early_stop=|speech_ms=4"))
+
+        self.assertEqual(parts, {"early_stop": "", "speech_ms": "4"})
+
+
+if __name__ == "__main__":
+    unittest.main()
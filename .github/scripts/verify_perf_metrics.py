@@ -1,30 +1,41 @@
 #!/usr/bin/env python3
 """Verify perf smoke voice metrics from log file."""
 
+import mmap
+import re
 import sys
 import pathlib
 
+MARKER = b"voice_metrics|"
+# Only the fields checked below, anchored to `|` boundaries like the old split.
+FIELD_RE = re.compile(r"(?:^|\|)(capture_ms|speech_ms|silence_tail_ms|frames_dropped|early_stop)=([^|]*)")
+
+def find_latest_line(log_path: pathlib.Path):
+    """Return the last line containing MARKER, scanning backward via mmap."""
+    with log_path.open("rb") as handle:
+        if log_path.stat().st_size == 0:
+            return None
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            hit = mm.rfind(MARKER)
+            if hit < 0:
+                return None
+            start = mm.rfind(b"\n", 0, hit) + 1
+            end = mm.find(b"\n", hit)
+            if end < 0:
+                end = len(mm)
+            return mm[start:end].decode("utf-8", errors="replace").strip()
+
 def main():
     log_path = pathlib.Path(sys.argv[1])
 
     if not log_path.exists():
         sys.exit(f"Log file not found: {log_path}")
 
-    lines = [
-        line.strip()
-        for line in log_path.read_text().splitlines()
-        if "voice_metrics|" in line
-    ]
-
-    if not lines:
+    latest = find_latest_line(log_path)
+    if latest is None:
         sys.exit("No voice_metrics lines found")
 
-    latest = lines[-1]
-    parts = {}
-    for chunk in latest.split("|"):
-        if "=" in chunk:
-            key, value = chunk.split("=", 1)
-            parts[key] = value
+    parts = dict(FIELD_RE.findall(latest))
 
     def get_number(key: str) -> float:
         try:
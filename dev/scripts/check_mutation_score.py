@@ -6,6 +6,19 @@ import json
 from pathlib import Path
 from typing import Dict, List, Tuple
 
+try:
+    import orjson  # Optional: faster parsing for large outcomes files.
+except ImportError:
+    orjson = None
+
+
+def load_json(path: Path) -> Dict:
+    """Parse a JSON file from raw bytes, preferring orjson when installed."""
+    raw = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 def counts_from_outcomes(data: Dict) -> Tuple[int, int, int, int]:
     """Fallback counter for older/newer outcomes schema variants."""
@@ -30,8 +43,7 @@ def counts_from_outcomes(data: Dict) -> Tuple[int, int, int, int]:
 
 def read_counts(path: Path) -> Dict[str, int]:
     """Read one outcomes.json and return normalized counters."""
-    with path.open("r", encoding="utf-8") as handle:
-        data = json.load(handle)
+    data = load_json(path)
 
     caught = int(data.get("caught", 0))
     missed = int(data.get("missed", 0))
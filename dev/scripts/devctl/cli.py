@@ -33,6 +33,10 @@ def build_parser() -> argparse.ArgumentParser:
     check_cmd.add_argument("--mutants-all", action="store_true")
     check_cmd.add_argument("--mutants-timeout", type=int, default=DEFAULT_MUTANTS_TIMEOUT)
     check_cmd.add_argument("--mutants-shard", help="Mutants shard spec like 1/8")
+    check_cmd.add_argument("--mutants-jobs", type=int, help="Parallel cargo-mutants workers")
+    check_cmd.add_argument("--mutants-incremental", action="store_true")
+    check_cmd.add_argument("--mutants-fail-fast", action="store_true")
+    check_cmd.add_argument("--mutants-no-tmpfs", action="store_true")
     check_cmd.add_argument("--mutants-offline", action="store_true")
     check_cmd.add_argument("--mutants-cargo-home")
     check_cmd.add_argument("--mutants-cargo-target-dir")
@@ -41,6 +45,7 @@ def build_parser() -> argparse.ArgumentParser:
     check_cmd.add_argument("--mutants-plot-top-pct", type=float)
     check_cmd.add_argument("--mutants-plot-output")
     check_cmd.add_argument("--mutants-plot-show", action="store_true")
+    check_cmd.add_argument("--mutants-plot-async", action="store_true")
     check_cmd.add_argument("--keep-going", action="store_true")
     check_cmd.add_argument("--dry-run", action="store_true")
     check_cmd.add_argument("--format", choices=["text", "json", "md"], default="text")
@@ -57,7 +62,12 @@ def build_parser() -> argparse.ArgumentParser:
     mutants_cmd.add_argument("--module")
     mutants_cmd.add_argument("--timeout", type=int, default=DEFAULT_MUTANTS_TIMEOUT)
     mutants_cmd.add_argument("--shard", help="Run one shard, e.g. 1/8")
+    mutants_cmd.add_argument("--jobs", "-j", type=int, help="Parallel cargo-mutants workers")
     mutants_cmd.add_argument("--results-only", action="store_true")
+    mutants_cmd.add_argument("--merge-shards", action="store_true", help="Merge shard outcomes (with --results-only)")
+    mutants_cmd.add_argument("--incremental", action="store_true", help="Skip modules unchanged since their last run")
+    mutants_cmd.add_argument("--fail-fast", action="store_true", help="Stop at the first surviving mutant")
+    mutants_cmd.add_argument("--no-tmpfs", action="store_true", help="Keep scratch builds off /dev/shm")
     mutants_cmd.add_argument("--json", action="store_true")
     mutants_cmd.add_argument("--offline", action="store_true")
     mutants_cmd.add_argument("--cargo-home")
@@ -67,6 +77,7 @@ def build_parser() -> argparse.ArgumentParser:
     mutants_cmd.add_argument("--plot-top-pct", type=float)
     mutants_cmd.add_argument("--plot-output")
     mutants_cmd.add_argument("--plot-show", action="store_true")
+    mutants_cmd.add_argument("--plot-async", action="store_true")
     mutants_cmd.add_argument("--top", type=int)
     mutants_cmd.add_argument("--dry-run", action="store_true")
 
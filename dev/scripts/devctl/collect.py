@@ -32,8 +32,10 @@ def collect_git_status() -> Dict:
             continue
         status = line[:2].strip()
         path = line[3:]
-        if "->" in path:
-            path = path.split("->")[-1].strip()
+        # Renames are reported as "old -> new"; keep the destination path.
+        _, arrow, renamed = path.rpartition("->")
+        if arrow:
+            path = renamed.strip()
         changes.append({"status": status, "path": path})
 
     changed_paths = {change["path"] for change in changes}
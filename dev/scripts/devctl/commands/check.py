@@ -117,7 +117,12 @@ def run(args) -> int:
                 module=args.mutants_module,
                 timeout=args.mutants_timeout,
                 shard=args.mutants_shard,
+                jobs=args.mutants_jobs,
                 results_only=False,
+                merge_shards=False,
+                incremental=args.mutants_incremental,
+                fail_fast=args.mutants_fail_fast,
+                no_tmpfs=args.mutants_no_tmpfs,
                 json=False,
                 offline=args.mutants_offline,
                 cargo_home=args.mutants_cargo_home,
@@ -127,6 +132,7 @@ def run(args) -> int:
                 plot_top_pct=args.mutants_plot_top_pct,
                 plot_output=args.mutants_plot_output,
                 plot_show=args.mutants_plot_show,
+                plot_async=args.mutants_plot_async,
                 top=None,
             )
             add_step("mutants", build_mutants_cmd(mutants_args), cwd=REPO_ROOT)
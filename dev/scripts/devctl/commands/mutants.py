@@ -17,8 +17,18 @@ def build_mutants_cmd(args) -> List[str]:
         cmd.extend(["--timeout", str(args.timeout)])
     if args.shard:
         cmd.extend(["--shard", args.shard])
+    if args.jobs:
+        cmd.extend(["--jobs", str(args.jobs)])
     if args.results_only:
         cmd.append("--results-only")
+    if args.merge_shards:
+        cmd.append("--merge-shards")
+    if args.incremental:
+        cmd.append("--incremental")
+    if args.fail_fast:
+        cmd.append("--fail-fast")
+    if args.no_tmpfs:
+        cmd.append("--no-tmpfs")
     if args.json:
         cmd.append("--json")
     if args.offline:
@@ -37,6 +47,8 @@ def build_mutants_cmd(args) -> List[str]:
         cmd.extend(["--plot-output", args.plot_output])
     if args.plot_show:
         cmd.append("--plot-show")
+    if args.plot_async:
+        cmd.append("--plot-async")
     if args.top:
         cmd.extend(["--top", str(args.top)])
     return cmd
@@ -5,10 +5,19 @@ import shutil
 import subprocess
 import time
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 
 from .config import REPO_ROOT, SRC_DIR
 
+MUTANTS_OUTPUT_DIR = SRC_DIR / "mutants.out"
+# Where cargo-mutants leaves outcomes.json inside an output root (-o DIR writes DIR/mutants.out/).
+OUTCOMES_SUBPATHS = ("outcomes.json", os.path.join("mutants.out", "outcomes.json"))
+# Direct children of mutants.out that are themselves output roots: one per shard and
+# one per module of a --fail-fast run (mutants.out/ is already covered by OUTCOMES_SUBPATHS).
+SHARD_DIR_PREFIX = "shard-"
+MODULE_DIR_PREFIX = "module-"
+OUTCOMES_DIR_PREFIXES = (SHARD_DIR_PREFIX, MODULE_DIR_PREFIX)
+
 
 def cmd_str(cmd: List[str]) -> str:
     """Render a command list as a printable string."""
@@ -23,7 +32,7 @@ def run_cmd(
     dry_run: bool = False,
 ) -> dict:
     """Run a command and return timing/exit metadata."""
-    start = time.time()
+    start_ns = time.monotonic_ns()
     if dry_run:
         print(f"[dry-run] {name}: {cmd_str(cmd)}")
         return {
@@ -36,7 +45,7 @@ def run_cmd(
         }
 
     result = subprocess.run(cmd, cwd=cwd, env=env)
-    duration = time.time() - start
+    duration = (time.monotonic_ns() - start_ns) / 1e9
     return {
         "name": name,
         "cmd": cmd,
@@ -102,13 +111,44 @@ def confirm_or_abort(message: str, assume_yes: bool) -> None:
         raise SystemExit(1)
 
 
-def find_latest_outcomes_file() -> Optional[Path]:
+def outcomes_in(directory) -> Iterator[Tuple[float, str]]:
+    """Yield (mtime, path) for outcomes.json at the known spots in one output root."""
+    for subpath in OUTCOMES_SUBPATHS:
+        path = os.path.join(directory, subpath)
+        try:
+            yield os.stat(path, follow_symlinks=False).st_mtime, path
+        except OSError:
+            continue
+
+
+def output_roots(directory=None, prefixes=OUTCOMES_DIR_PREFIXES) -> Iterator[str]:
+    """Yield direct subdirectories of directory that are per-shard/per-module output roots."""
+    try:
+        entries = os.scandir(directory or MUTANTS_OUTPUT_DIR)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            if entry.name.startswith(prefixes) and entry.is_dir(follow_symlinks=False):
+                yield entry.path
+
+
+def iter_outcomes_files(directory=None) -> Iterator[Tuple[float, str]]:
+    """Yield (mtime, path) for outcomes.json in directory and its output subdirs.
+
+    Only the known layouts are probed, so the per-mutant log dirs are never walked.
+    """
+    directory = directory or MUTANTS_OUTPUT_DIR
+    yield from outcomes_in(directory)
+    for root in output_roots(directory):
+        yield from outcomes_in(root)
+
+
+def find_latest_outcomes_file(directory=None) -> Optional[Path]:
     """Locate the newest outcomes.json under src/mutants.out."""
-    output_dir = SRC_DIR / "mutants.out"
-    primary = output_dir / "outcomes.json"
+    directory = Path(directory or MUTANTS_OUTPUT_DIR)
+    primary = directory / "outcomes.json"
     if primary.exists():
         return primary
-    candidates = list(output_dir.rglob("outcomes.json"))
-    if not candidates:
-        return None
-    return max(candidates, key=lambda path: path.stat().st_mtime)
+    latest = max(iter_outcomes_files(directory), default=None)
+    return Path(latest[1]) if latest else None
@@ -0,0 +1,308 @@
+"""Tests for mutants.py shard handling, module selection, and the run/report flow."""
+
+import contextlib
+import io
+import json
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from dev.scripts import mutants
+
+
+def _outcome(summary: str, path: str) -> dict:
+    return {"summary": summary, "scenario": {"Mutant": {"file": path, "span": {"start": {"line": 1}}}}}
+
+
+class ShardTests(unittest.TestCase):
+    """Validate 1-based shard specs and merging of per-shard outcomes."""
+
+    def setUp(self) -> None:
+        self.original_output_dir = mutants.OUTPUT_DIR
+
+    def tearDown(self) -> None:
+        mutants.OUTPUT_DIR = self.original_output_dir
+
+    def test_cargo_shard_args_are_zero_based(self) -> None:
+        total = 4
+        for index in range(1, total + 1):
+            with self.subTest(index=index):
+                shard = mutants.parse_shard_spec(f"{index}/{total}")
+
+                self.assertEqual(mutants.cargo_shard_args(shard), ["--shard", f"{index - 1}/{total}"])
+
+    def test_parse_shard_spec_rejects_zero_and_overflow(self) -> None:
+        for spec in ("0/4", "5/4", "1/0", "1-4"):
+            with self.subTest(spec=spec):
+                with self.assertRaises(ValueError):
+                    mutants.parse_shard_spec(spec)
+
+    def test_merge_shards_combines_every_shard(self) -> None:
+        total = 3
+        with tempfile.TemporaryDirectory() as tmp:
+            mutants.OUTPUT_DIR = Path(tmp)
+            for index in range(1, total + 1):
+                # cargo-mutants -o DIR writes DIR/mutants.out/outcomes.json.
+                outcomes_dir = mutants.shard_output_dir(f"{index}/{total}") / "mutants.out"
+                outcomes_dir.mkdir(parents=True)
+                data = {
+                    "outcomes": [
+                        _outcome("CaughtMutant", f"src/shard{index}.rs"),
+                        _outcome("MissedMutant", f"src/shard{index}.rs"),
+                    ],
+                    "caught": 1,
+                    "missed": 1,
+                    "timeout": 0,
+                    "unviable": 0,
+                    "total_mutants": 2,
+                }
+                (outcomes_dir / "outcomes.json").write_text(json.dumps(data), encoding="utf-8")
+            # Only shard-* roots are merged, not other runs under mutants.out.
+            (Path(tmp) / "module-audio/mutants.out").mkdir(parents=True)
+            (Path(tmp) / "module-audio/mutants.out/outcomes.json").write_text(
+                json.dumps({"outcomes": [_outcome("MissedMutant", "src/audio.rs")], "missed": 1}),
+                encoding="utf-8",
+            )
+
+            merged = mutants.merge_shards()
+            results = mutants.parse_results(merged=True)
+
+        self.assertEqual(len(merged["merged_files"]), total)
+        for index in range(1, total + 1):
+            self.assertTrue(any(f"shard-{index}-of-{total}" in path for path in merged["merged_files"]))
+        self.assertEqual(merged["caught"], total)
+        self.assertEqual(merged["missed"], total)
+        self.assertEqual(merged["total_mutants"], 2 * total)
+        self.assertEqual(len(merged["outcomes"]), 2 * total)
+        self.assertEqual(results["stats"]["killed"], total)
+        self.assertEqual(results["stats"]["survived"], total)
+        self.assertAlmostEqual(results["score"], 50.0)
+        self.assertNotIn("src/audio.rs", results["survived_by_file"])
+
+    def test_merge_shards_without_shards_returns_none(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            mutants.OUTPUT_DIR = Path(tmp)
+
+            self.assertIsNone(mutants.merge_shards())
+
+
+# Module name -> the one source file the fake cargo-mutants run reports on.
+MODULE_FILES = {
+    "stt": "src/stt.rs",
+    "voice": "src/voice.rs",
+    "ipc": "src/ipc/mod.rs",
+    "app": "src/legacy/state.rs",
+    "legacy_tui": "src/legacy/state.rs",
+}
+
+
+class MutantsTreeTestCase(unittest.TestCase):
+    """Point mutants.py at a throwaway crate under a temp dir."""
+
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        src_dir = Path(tmp.name) / "src"
+        for path in set(MODULE_FILES.values()):
+            (src_dir / path).parent.mkdir(parents=True, exist_ok=True)
+            (src_dir / path).write_text("fn f() {}\n", encoding="utf-8")
+        (src_dir / "Cargo.toml").write_text("[package]\n", encoding="utf-8")
+        output_dir = src_dir / "mutants.out"
+        modules = {
+            "stt": {"desc": "", "files": ("src/stt.rs",), "timeout": 60},
+            "voice": {"desc": "", "files": ("src/voice.rs",), "timeout": 60},
+            "ipc": {"desc": "", "files": ("src/ipc/**",), "timeout": 60},
+            "app": {"desc": "", "files": ("src/legacy/**",), "timeout": 60},
+            "legacy_tui": {"desc": "", "files": ("src/legacy/**",), "timeout": 60},
+        }
+        overrides = {
+            "SRC_DIR": src_dir,
+            "OUTPUT_DIR": output_dir,
+            "CACHE_FILE": src_dir / ".mutants-cache.json",
+            "PRIORITY_FILE": src_dir / ".mutants-priority.json",
+            "INCREMENTAL_DIR": output_dir / "incremental",
+            "REPORT_OUTCOMES_FILE": output_dir / "mutants.out" / "outcomes.json",
+            "MODULES": modules,
+        }
+        for name, value in overrides.items():
+            patch = mock.patch.object(mutants, name, value)
+            patch.start()
+            self.addCleanup(patch.stop)
+        self.src_dir = src_dir
+
+
+class DedupeModulesTests(MutantsTreeTestCase):
+    """Validate module selection cleanup before a run."""
+
+    def test_modules_with_the_same_files_run_once(self) -> None:
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            selected = mutants.dedupe_modules(["app", "stt", "legacy_tui"])
+
+        self.assertEqual(selected, ["app", "stt"])
+        self.assertIn("same files as 'app'", out.getvalue())
+
+    def test_unknown_modules_are_dropped(self) -> None:
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            selected = mutants.dedupe_modules(["nope", "voice"])
+
+        self.assertEqual(selected, ["voice"])
+        self.assertIn("unknown module 'nope'", out.getvalue())
+
+
+class MainFlowTests(MutantsTreeTestCase):
+    """Drive main() with a fake cargo-mutants run per invocation."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        # Module -> (outcome summaries, exit code) the fake run reports.
+        self.plan = {}
+        self.runs = []
+        patch = mock.patch.object(mutants, "run_mutants", side_effect=self._fake_run)
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    def _fake_run(self, modules, timeout, **kwargs):
+        self.runs.append((list(modules), kwargs.get("skip_baseline", False)))
+        outcomes, returncode = [], 0
+        counters = {"caught": 0, "missed": 0, "timeout": 0, "unviable": 0}
+        keys = {"CaughtMutant": "caught", "MissedMutant": "missed", "Timeout": "timeout"}
+        for mod in modules:
+            summaries, mod_returncode = self.plan.get(mod, (["CaughtMutant"], 0))
+            returncode = returncode or mod_returncode
+            for summary in summaries:
+                outcomes.append(_outcome(summary, MODULE_FILES[mod]))
+                counters[keys[summary]] += 1
+        outcomes_dir = Path(kwargs["output_dir"]) / "mutants.out"
+        outcomes_dir.mkdir(parents=True, exist_ok=True)
+        data = {"outcomes": outcomes, "total_mutants": len(outcomes), **counters}
+        (outcomes_dir / "outcomes.json").write_text(json.dumps(data), encoding="utf-8")
+        return returncode
+
+    def _main(self, *argv) -> int:
+        with mock.patch.object(sys, "argv", ["mutants.py", *argv]), contextlib.redirect_stdout(io.StringIO()):
+            try:
+                mutants.main()
+            except SystemExit as exc:
+                return exc.code or 0
+        return 0
+
+    def _report(self) -> dict:
+        return json.loads(mutants.REPORT_OUTCOMES_FILE.read_text(encoding="utf-8"))
+
+    def test_incremental_round_trip_skips_and_reports_cached_modules(self) -> None:
+        self.plan["stt"] = (["CaughtMutant", "MissedMutant"], 2)
+
+        self.assertEqual(self._main("--module", "stt,voice", "--incremental"), 2)
+        cache = json.loads(mutants.CACHE_FILE.read_text(encoding="utf-8"))
+        self.assertEqual(cache["stt"]["returncode"], 2)
+        self.assertEqual(cache["stt"]["score"], 50.0)
+        self.assertEqual(cache["voice"]["returncode"], 0)
+        self.assertTrue((self.src_dir / cache["voice"]["outcomes"]).is_file())
+
+        # Nothing changed: no run, and the cached survivor still drives the exit code.
+        self.runs.clear()
+        self.assertEqual(self._main("--module", "stt,voice", "--incremental"), 2)
+        self.assertEqual(self.runs, [])
+        self.assertEqual(len(self._report()["outcomes"]), 3)
+
+        # Touch one module: only it reruns; the merged report still covers both.
+        (self.src_dir / "src/voice.rs").write_text("fn g() {}\n", encoding="utf-8")
+        self.plan["stt"] = (["CaughtMutant"], 0)
+        self.assertEqual(self._main("--module", "stt,voice", "--incremental"), 2)
+        self.assertEqual([modules for modules, _ in self.runs], [["voice"]])
+        self.assertEqual(len(self._report()["outcomes"]), 3)
+
+    def test_incremental_rerun_when_snapshot_is_missing(self) -> None:
+        self.assertEqual(self._main("--module", "stt", "--incremental"), 0)
+        for path in mutants.INCREMENTAL_DIR.iterdir():
+            path.unlink()
+        self.runs.clear()
+
+        self.assertEqual(self._main("--module", "stt", "--incremental"), 0)
+        self.assertEqual([modules for modules, _ in self.runs], [["stt"]])
+
+    def test_fail_fast_stops_at_survivor_and_merges_every_module(self) -> None:
+        self.plan["stt"] = (["Timeout"], 3)
+        self.plan["ipc"] = (["CaughtMutant", "MissedMutant"], 2)
+
+        returncode = self._main("--module", "stt,ipc,voice", "--fail-fast")
+
+        self.assertEqual(returncode, 2)
+        # Timeouts keep going; the survivor stops before voice; one baseline is enough.
+        self.assertEqual(self.runs, [(["stt"], False), (["ipc"], True)])
+        report = self._report()
+        self.assertEqual(len(report["outcomes"]), 3)
+        self.assertEqual(report["missed"], 1)
+        self.assertEqual(report["timeout"], 1)
+
+    def test_fail_fast_keeps_timeout_exit_code(self) -> None:
+        self.plan["stt"] = (["Timeout"], 3)
+
+        self.assertEqual(self._main("--module", "stt,voice", "--fail-fast"), 3)
+        self.assertEqual([modules for modules, _ in self.runs], [["stt"], ["voice"]])
+
+    def test_fail_fast_reports_tool_failure(self) -> None:
+        self.plan["stt"] = ([], 4)
+
+        self.assertEqual(self._main("--module", "stt,voice", "--fail-fast"), 4)
+        self.assertEqual([modules for modules, _ in self.runs], [["stt"]])
+
+    def test_fail_fast_rejects_shard(self) -> None:
+        self.assertEqual(self._main("--module", "stt", "--fail-fast", "--shard", "1/2"), 2)
+        self.assertEqual(self.runs, [])
+
+
+class StreamMutantsTests(unittest.TestCase):
+    """Validate the --fail-fast stop: SIGINT first, kill after the grace period."""
+
+    def _stream(self, child: str) -> tuple[int, bytes]:
+        stdout = io.TextIOWrapper(io.BytesIO())
+        with contextlib.redirect_stdout(stdout):
+            returncode = mutants.stream_mutants([sys.executable, "-c", child], None, fail_fast=True)
+            stdout.flush()
+        return returncode, stdout.buffer.getvalue()
+
+    def test_survivor_interrupts_run_and_drains_its_output(self) -> None:
+        child = (
+            "import signal, sys, time\n"
+            "def stop(*_):\n"
+            "    print('interrupted', flush=True); sys.exit(130)\n"
+            "signal.signal(signal.SIGINT, stop)\n"
+            "print('MISSED src/stt.rs:1:1: replace f', flush=True)\n"
+            "time.sleep(30)\n"
+        )
+        start = time.monotonic()
+
+        returncode, output = self._stream(child)
+
+        self.assertEqual(returncode, 2)
+        self.assertIn(b"interrupted", output)
+        self.assertLess(time.monotonic() - start, 10)
+
+    def test_run_ignoring_sigint_is_killed_after_grace(self) -> None:
+        child = (
+            "import signal, time\n"
+            "signal.signal(signal.SIGINT, signal.SIG_IGN)\n"
+            "print('MISSED src/stt.rs:1:1: replace f', flush=True)\n"
+            "time.sleep(30)\n"
+        )
+        start = time.monotonic()
+
+        with mock.patch.object(mutants, "FAIL_FAST_STOP_GRACE_SECONDS", 0.5):
+            returncode, _ = self._stream(child)
+
+        self.assertEqual(returncode, 2)
+        self.assertLess(time.monotonic() - start, 10)
+
+    def test_clean_run_returns_its_exit_code(self) -> None:
+        returncode, output = self._stream("print('caught src/stt.rs'); raise SystemExit(3)")
+
+        self.assertEqual(returncode, 3)
+        self.assertIn(b"Live tally: caught 1", output)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -10,66 +10,90 @@ Usage:
     python3 dev/scripts/mutants.py --all        # Run all modules
     python3 dev/scripts/mutants.py --module audio  # Specific module
     python3 dev/scripts/mutants.py --list       # List available modules
+    python3 dev/scripts/mutants.py --results-only --merge-shards  # Combine shard outputs
     python3 dev/scripts/mutants.py --module overlay --offline --cargo-home /tmp/cargo-home --cargo-target-dir /tmp/cargo-target
 """
 
 import argparse
+import atexit
+import functools
+import hashlib
 import json
 import math
 import os
 import re
+import shutil
+import signal
 import subprocess
 import sys
+import threading
 from collections import Counter
 from typing import Optional
 from pathlib import Path
 from datetime import datetime
 
+SCRIPT_DIR = Path(__file__).resolve().parent
+if str(SCRIPT_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPT_DIR))
+
+from devctl.common import (  # noqa: E402
+    MODULE_DIR_PREFIX,
+    SHARD_DIR_PREFIX,
+    find_latest_outcomes_file,
+    outcomes_in,
+    output_roots,
+)
+
+try:
+    import ijson  # Optional: stream large outcomes files instead of loading them whole.
+except ImportError:
+    ijson = None
+
 # Module definitions with their source paths
 MODULES = {
     "audio": {
         "desc": "Audio capture, VAD, resampling",
-        "files": ["src/audio/**"],
+        "files": ("src/audio/**",),
         "timeout": 120,
     },
     "stt": {
         "desc": "Whisper transcription",
-        "files": ["src/stt.rs"],
+        "files": ("src/stt.rs",),
         "timeout": 120,
     },
     "voice": {
         "desc": "Voice capture orchestration",
-        "files": ["src/voice.rs"],
+        "files": ("src/voice.rs",),
         "timeout": 120,
     },
     "config": {
         "desc": "CLI flags and validation",
-        "files": ["src/config/**"],
+        "files": ("src/config/**",),
         "timeout": 60,
     },
     "pty": {
         "desc": "PTY session handling",
-        "files": ["src/pty_session/**"],
+        "files": ("src/pty_session/**",),
         "timeout": 120,
     },
     "ipc": {
         "desc": "JSON IPC protocol",
-        "files": ["src/ipc/**"],
+        "files": ("src/ipc/**",),
         "timeout": 90,
     },
     "app": {
         "desc": "Legacy TUI state and logging (compat alias)",
-        "files": ["src/legacy_tui/**", "src/legacy_ui.rs"],
+        "files": ("src/legacy_tui/**", "src/legacy_ui.rs"),
         "timeout": 90,
     },
     "legacy_tui": {
         "desc": "Legacy TUI state and logging",
-        "files": ["src/legacy_tui/**", "src/legacy_ui.rs"],
+        "files": ("src/legacy_tui/**", "src/legacy_ui.rs"),
         "timeout": 90,
     },
     "overlay": {
         "desc": "Overlay binary (main, writer, status)",
-        "files": ["src/bin/voiceterm/**"],
+        "files": ("src/bin/voiceterm/**",),
         "timeout": 180,
     },
 }
@@ -78,77 +102,131 @@ CAUGHT_SUMMARIES = {"CaughtMutant", "Killed"}
 MISSED_SUMMARIES = {"MissedMutant", "Survived"}
 TIMEOUT_SUMMARIES = {"Timeout"}
 UNVIABLE_SUMMARIES = {"Unviable"}
+# Outcome summary -> stats key, so each outcome costs one dict lookup.
+STATUS_KEYS = {
+    **dict.fromkeys(CAUGHT_SUMMARIES, "killed"),
+    **dict.fromkeys(MISSED_SUMMARIES, "survived"),
+    **dict.fromkeys(TIMEOUT_SUMMARIES, "timeout"),
+    **dict.fromkeys(UNVIABLE_SUMMARIES, "unviable"),
+}
 
 REPO_ROOT = Path(__file__).parent.parent.parent
 SRC_DIR = REPO_ROOT / "src"
 OUTPUT_DIR = SRC_DIR / "mutants.out"
-
-
-def find_latest_outcomes_file() -> Optional[Path]:
-    """Return the newest outcomes.json under mutants.out (if any)."""
-    primary = OUTPUT_DIR / "outcomes.json"
-    if primary.exists():
-        return primary
-    candidates = list(OUTPUT_DIR.rglob("outcomes.json"))
-    if not candidates:
-        return None
-    return max(candidates, key=lambda path: path.stat().st_mtime)
-
-
+CACHE_FILE = SRC_DIR / ".mutants-cache.json"
+# Per-module outcomes kept for --incremental, so skipped modules can still be reported.
+INCREMENTAL_DIR = OUTPUT_DIR / "incremental"
+# Where a plain run's cargo-mutants writes outcomes.json (-o mutants.out), and where a
+# merged --fail-fast/--incremental report is written so --results-only finds all of it.
+REPORT_OUTCOMES_FILE = OUTPUT_DIR / "mutants.out" / "outcomes.json"
+PRIORITY_FILE = SRC_DIR / ".mutants-priority.json"
+# Build inputs that invalidate every cached module when they change.
+CACHE_GLOBAL_INPUTS = ("Cargo.toml", "Cargo.lock")
+# cargo-mutants exit codes for a completed run (clean, missed mutants, timeouts).
+COMPLETED_RETURNCODES = {0, 2, 3}
+# RAM-backed scratch space for cargo-mutants' per-worker build trees.
+TMPFS_DIR = Path("/dev/shm")
+# Headroom on top of the estimated scratch size, for the rest of the system.
+TMPFS_HEADROOM_BYTES = 2 * 1024**3
+# How long a --fail-fast stop waits for cargo-mutants to exit after SIGINT before killing it.
+FAIL_FAST_STOP_GRACE_SECONDS = 30
+# Leading words of the per-mutant lines cargo-mutants prints while running.
+LIVE_OUTCOME_WORDS = {b"MISSED", b"TIMEOUT", b"caught", b"unviable"}
+# Streaming only saves memory, so smaller files are read whole with json.load.
+STREAM_PARSE_MIN_BYTES = 1 << 20
+
+
+@functools.lru_cache(maxsize=32)
 def normalize_top_pct(value: float) -> float:
-    """Normalize a percentage (0-1 or 0-100) into a 0-1 float."""
-    if value <= 0:
-        return 0.0
-    if value > 1:
-        return value / 100.0
-    return min(value, 1.0)
+    """Normalize a percentage (0-1 or 0-100) into a 0-1 float, clamped to [0, 1]."""
+    return max(0.0, min(1.0, value / 100.0 if value > 1 else value))
 
 
 def top_items(counter: Counter, top_pct: float) -> list[tuple[str, int]]:
     """Return the top N items based on a percentage of the list length."""
-    items = counter.most_common()
-    if not items:
+    total = len(counter)
+    if not total:
         return []
     pct = normalize_top_pct(top_pct)
     if pct <= 0:
         return []
-    count = max(1, int(math.ceil(len(items) * pct)))
-    return items[:count]
+    count = max(1, int(math.ceil(total * pct)))
+    # most_common(k) is a heap selection, O(n log k), instead of a full sort.
+    return counter.most_common(count)
 
 
-def plot_hotspots(results, scope: str, top_pct: float, output_path: Optional[str], show: bool) -> None:
-    """Plot survived mutant hotspots (file or dir) using matplotlib."""
-    if results is None:
-        return
-    counter = results["survived_by_file"] if scope == "file" else results["survived_by_dir"]
-    items = top_items(counter, top_pct)
-    if not items:
-        print("No survived mutants to plot.")
-        return
+@functools.lru_cache(maxsize=1)
+def get_matplotlib():
+    """Import pyplot and NumPy once, picking a headless backend when needed.
 
+    Returns (plt, np), or None when matplotlib is not installed. Kept lazy so
+    non-plot invocations never pay matplotlib's import cost.
+    """
     try:
         import matplotlib
         if not os.environ.get("DISPLAY") and not os.environ.get("MPLBACKEND"):
             # Headless-friendly default for CI/sandboxed runs.
             matplotlib.use("Agg")
         import matplotlib.pyplot as plt
+        import numpy as np  # Always installed alongside matplotlib.
     except ImportError:
+        return None
+    return plt, np
+
+
+def savefig_worker(pickled_fig: bytes, output_file: str) -> None:
+    """Render a pickled figure to disk (runs in a background process)."""
+    import pickle
+
+    import matplotlib
+    matplotlib.use("Agg")
+
+    fig = pickle.loads(pickled_fig)
+    fig.savefig(output_file, dpi=150)
+
+
+def plot_hotspots(
+    results,
+    scope: str,
+    top_pct: float,
+    output_path: Optional[str],
+    show: bool,
+    async_save: bool = False,
+) -> None:
+    """Plot survived mutant hotspots (file or dir) using matplotlib.
+
+    With async_save the PNG is encoded in a spawned process that is joined
+    at interpreter exit, keeping savefig off the CLI's critical path.
+    """
+    if results is None:
+        return
+    counter = results["survived_by_file"] if scope == "file" else results["survived_by_dir"]
+    items = top_items(counter, top_pct)
+    if not items:
+        print("No survived mutants to plot.")
+        return
+
+    modules = get_matplotlib()
+    if modules is None:
         print("matplotlib not installed. Install with: pip install matplotlib")
         return
+    plt, np = modules
 
+    # Hand matplotlib arrays directly so it does not convert lists internally.
     labels = [path for path, _ in items]
-    values = [count for _, count in items]
-    y_pos = list(range(len(labels)))
+    values = np.fromiter((count for _, count in items), dtype=np.int64, count=len(items))
+    y_pos = np.arange(len(items))
 
     fig_height = max(3.0, 0.4 * len(labels))
-    fig, ax = plt.subplots(figsize=(10, fig_height))
+    # constrained_layout solves once at draw time; tight_layout iterates.
+    fig, ax = plt.subplots(figsize=(10, fig_height), constrained_layout=True)
     ax.barh(y_pos, values, color="#3b82f6")
     ax.set_yticks(y_pos)
     ax.set_yticklabels(labels, fontsize=8)
     ax.invert_yaxis()
     ax.set_xlabel("Survived mutants")
-    ax.set_title(f"Top {scope} hotspots (top {normalize_top_pct(top_pct) * 100:.0f}%)")
-    fig.tight_layout()
+    top_pct_label = normalize_top_pct(top_pct) * 100
+    ax.set_title(f"Top {scope} hotspots (top {top_pct_label:.0f}%)")
 
     results_dir = Path(results["results_dir"])
     if output_path:
@@ -156,8 +234,19 @@ def plot_hotspots(results, scope: str, top_pct: float, output_path: Optional[str
     else:
         output_file = results_dir / f"mutants-top-{scope}.png"
     output_file.parent.mkdir(parents=True, exist_ok=True)
-    fig.savefig(output_file, dpi=150)
-    print(f"Plot saved to: {output_file}")
+    if async_save:
+        # Imported here: multiprocessing alone adds ~20 ms to every CLI start.
+        import multiprocessing
+        import pickle
+
+        ctx = multiprocessing.get_context("spawn")
+        process = ctx.Process(target=savefig_worker, args=(pickle.dumps(fig), str(output_file)))
+        process.start()
+        atexit.register(process.join)
+        print(f"Plot saving in background to: {output_file}")
+    else:
+        fig.savefig(output_file, dpi=150)
+        print(f"Plot saved to: {output_file}")
     if show:
         plt.show()
     plt.close(fig)
@@ -208,13 +297,203 @@ def select_modules_interactive():
     return selected if selected else module_list[:1]  # Default to first module
 
 
+def default_jobs() -> int:
+    """Default cargo-mutants worker count: half the CPUs, to limit RAM pressure."""
+    return max(1, (os.cpu_count() or 2) // 2)
+
+
+def module_source_files(module: str) -> list[Path]:
+    """Expand a module's file globs (relative to src/) into a sorted file list."""
+    files = set()
+    for pattern in MODULES[module]["files"]:
+        for path in SRC_DIR.glob(pattern):
+            if path.is_dir():
+                files.update(child for child in path.rglob("*") if child.is_file())
+            elif path.is_file():
+                files.add(path)
+    return sorted(files)
+
+
+def module_hash(module: str) -> str:
+    """Hash a module's sources plus the global build inputs (chunked reads)."""
+    digest = hashlib.sha256()
+    global_inputs = [SRC_DIR / name for name in CACHE_GLOBAL_INPUTS]
+    for path in module_source_files(module) + global_inputs:
+        digest.update(str(path.relative_to(SRC_DIR)).encode())
+        digest.update(b"\0")
+        if not path.exists():
+            continue
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 16), b""):
+                digest.update(block)
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def load_cache() -> dict:
+    """Load the incremental mutation cache (module -> last completed run)."""
+    try:
+        with open(CACHE_FILE) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def save_cache(cache: dict) -> None:
+    """Persist the incremental mutation cache."""
+    with open(CACHE_FILE, "w") as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+
+
+def cached_outcomes_file(entry: dict) -> Optional[Path]:
+    """Return a cache entry's outcomes snapshot if it is still on disk."""
+    relative = entry.get("outcomes")
+    path = SRC_DIR / relative if relative else None
+    return path if path is not None and path.is_file() else None
+
+
+def split_cached_modules(modules, cache: dict) -> tuple[list[str], list[str]]:
+    """Split modules into (changed, unchanged) relative to the cache.
+
+    A module only counts as unchanged while its outcomes snapshot still exists.
+    """
+    changed, unchanged = [], []
+    for mod in modules:
+        entry = cache.get(mod)
+        if (
+            mod in MODULES
+            and entry
+            and entry.get("hash") == module_hash(mod)
+            and cached_outcomes_file(entry) is not None
+        ):
+            unchanged.append(mod)
+        else:
+            changed.append(mod)
+    return changed, unchanged
+
+
+def load_priority() -> dict:
+    """Load per-module survivor counts from the previous run ({} if none)."""
+    try:
+        with open(PRIORITY_FILE) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    modules = data.get("modules") if isinstance(data, dict) else None
+    return modules if isinstance(modules, dict) else {}
+
+
+def save_priority(modules, results) -> None:
+    """Record survivors per file and per tested module for defect-first ordering."""
+    survived_by_file = results["survived_by_file"]
+    priority = load_priority()
+    for mod in modules:
+        if mod in MODULES:
+            files = {str(path.relative_to(SRC_DIR)) for path in module_source_files(mod)}
+            priority[mod] = sum(count for path, count in survived_by_file.items() if path in files)
+    with open(PRIORITY_FILE, "w") as f:
+        json.dump(
+            {
+                "modules": priority,
+                "survived_by_file": dict(survived_by_file.most_common()),
+                "timestamp": results["timestamp"],
+            },
+            f,
+            indent=2,
+        )
+
+
+def order_modules_by_priority(modules, priority: dict) -> list[str]:
+    """Order modules defect-first: prior survivors (or never tested) run first."""
+    return sorted(modules, key=lambda mod: -priority.get(mod, math.inf))
+
+
+def available_memory() -> Optional[int]:
+    """Return MemAvailable in bytes from /proc/meminfo (None off Linux)."""
+    try:
+        with open("/proc/meminfo") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def tree_size(path: Path, skip=()) -> int:
+    """Return the apparent size in bytes of the files under path (symlinks not followed)."""
+    total = 0
+    stack = [path]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in skip:
+                            stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        total += entry.stat(follow_symlinks=False).st_size
+                except OSError:
+                    continue
+    return total
+
+
+def scratch_bytes_per_worker(cargo_target_dir=None) -> int:
+    """Estimate one cargo-mutants worker's scratch tree: a source copy plus its build."""
+    target = Path(cargo_target_dir or os.environ.get("CARGO_TARGET_DIR") or SRC_DIR / "target")
+    return tree_size(SRC_DIR, skip=("target", OUTPUT_DIR.name)) + tree_size(target.expanduser())
+
+
+@functools.lru_cache(maxsize=1)
+def tmpfs_scratch_dir(jobs: int, cargo_target_dir=None) -> Optional[Path]:
+    """Create a per-run scratch dir on /dev/shm when it and RAM can hold every worker.
+
+    cargo-mutants copies the tree and builds each worker under TMPDIR, so a
+    tmpfs there skips the disk fsync path for thousands of small build files.
+    The space needed is jobs x the measured source + target size (tmpfs pages
+    are RAM, so MemAvailable must cover it too). An explicit TMPDIR wins.
+    The dir is removed at exit.
+    """
+    if os.environ.get("TMPDIR"):
+        print(f"Note: TMPDIR is set ({os.environ['TMPDIR']}); not using {TMPFS_DIR} for scratch builds.")
+        return None
+    try:
+        free = shutil.disk_usage(TMPFS_DIR).free
+    except OSError:
+        # No /dev/shm (e.g. macOS): stay on the default TMPDIR without a note.
+        return None
+    available = available_memory()
+    if available is None or min(free, available) < TMPFS_HEADROOM_BYTES:
+        return None
+    # Only walk the source and target trees once the cheap checks pass.
+    needed = jobs * scratch_bytes_per_worker(cargo_target_dir) + TMPFS_HEADROOM_BYTES
+    if free < needed or available < needed:
+        print(
+            f"Note: {jobs} worker(s) need ~{needed / 1024**3:.1f} GiB of scratch space, more than "
+            f"{TMPFS_DIR} or available RAM allows; using the default TMPDIR (see --no-tmpfs)."
+        )
+        return None
+    path = TMPFS_DIR / f"mutants-{os.getpid()}"
+    try:
+        path.mkdir(exist_ok=True)
+    except OSError:
+        return None
+    atexit.register(shutil.rmtree, path, ignore_errors=True)
+    return path
+
+
 def cargo_home_has_cache(path: Path) -> bool:
     """Detect whether a CARGO_HOME has registry/git cache data."""
     return (path / "registry").exists() or (path / "git").exists()
 
 
 def parse_shard_spec(shard: Optional[str]) -> Optional[str]:
-    """Validate cargo-mutants shard syntax (e.g. 1/8)."""
+    """Validate 1-based shard syntax (e.g. 1/8), matching the CI job labels."""
     if shard is None:
         return None
     match = re.fullmatch(r"(\d+)/(\d+)", shard.strip())
@@ -284,27 +563,248 @@ def scenario_fields(outcome: dict) -> dict:
     }
 
 
-def run_mutants(modules, timeout=300, cargo_home=None, cargo_target_dir=None, offline=False, shard=None):
-    """Run cargo mutants on selected modules."""
-    # Build file filter args
-    file_args = []
+def shard_output_dir(shard: str) -> Path:
+    """Return the per-shard cargo-mutants output root (e.g. mutants.out/shard-1-of-8)."""
+    index, total = shard.split("/")
+    return OUTPUT_DIR / f"{SHARD_DIR_PREFIX}{index}-of-{total}"
+
+
+def cargo_shard_args(shard: str) -> list[str]:
+    """Return cargo-mutants' --shard args for a 1-based N/M spec (cargo-mutants is 0-based)."""
+    index, total = shard.split("/")
+    return ["--shard", f"{int(index) - 1}/{total}"]
+
+
+def module_output_dir(module: str) -> Path:
+    """Return the per-module output root used by --fail-fast (e.g. mutants.out/module-audio)."""
+    return OUTPUT_DIR / f"{MODULE_DIR_PREFIX}{module}"
+
+
+def latest_outcomes_in(root: Path) -> Optional[Path]:
+    """Return the outcomes.json a run wrote into its output root, if any."""
+    latest = max(outcomes_in(root), default=None)
+    return Path(latest[1]) if latest else None
+
+
+def shard_outcomes_files() -> list[Path]:
+    """Return outcomes.json files written by sharded runs."""
+    return sorted(
+        Path(path)
+        for root in output_roots(OUTPUT_DIR, prefixes=(SHARD_DIR_PREFIX,))
+        for _, path in outcomes_in(root)
+    )
+
+
+def merge_outcomes(paths) -> Optional[dict]:
+    """Concatenate several outcomes.json files into one outcomes.json-shaped dict."""
+    if not paths:
+        return None
+    merged = {
+        "outcomes": [],
+        "caught": 0,
+        "missed": 0,
+        "timeout": 0,
+        "unviable": 0,
+        "total_mutants": 0,
+        "merged_files": [str(path) for path in paths],
+    }
+    for path in paths:
+        with open(path) as f:
+            data = json.load(f)
+        outcomes = data.get("outcomes", [])
+        merged["outcomes"].extend(outcomes)
+        for key in ("caught", "missed", "timeout", "unviable"):
+            merged[key] += int(data.get(key, 0))
+        merged["total_mutants"] += int(data.get("total_mutants", len(outcomes)))
+    return merged
+
+
+def merge_shards() -> Optional[dict]:
+    """Concatenate per-shard outcomes into one outcomes.json-shaped dict."""
+    return merge_outcomes(shard_outcomes_files())
+
+
+def mutation_score(killed: int, survived: int, timeout: int) -> float:
+    """Return the kill percentage over testable (caught, missed, timed-out) mutants."""
+    testable = killed + survived + timeout
+    return (killed / testable * 100) if testable > 0 else 0
+
+
+def split_outcomes_by_module(modules, outcomes) -> dict[str, dict]:
+    """Split one run's outcomes into per-module outcomes.json-shaped snapshots.
+
+    outcomes is consumed once (it may be an ijson stream); each snapshot keeps
+    only the outcomes in its module's files, with counters recomputed.
+    """
+    snapshots = {
+        mod: {"outcomes": [], "caught": 0, "missed": 0, "timeout": 0, "unviable": 0} for mod in modules
+    }
+    owners = {}
+    for mod in modules:
+        for path in module_source_files(mod):
+            owners.setdefault(str(path.relative_to(SRC_DIR)), []).append(snapshots[mod])
+    counter_keys = {"killed": "caught", "survived": "missed", "timeout": "timeout", "unviable": "unviable"}
+    for outcome in outcomes:
+        targets = owners.get(scenario_fields(outcome)["file"])
+        if not targets:
+            continue
+        key = STATUS_KEYS.get(outcome.get("summary"))
+        for snapshot in targets:
+            snapshot["outcomes"].append(outcome)
+            if key is not None:
+                snapshot[counter_keys[key]] += 1
+    for snapshot in snapshots.values():
+        snapshot["total_mutants"] = len(snapshot["outcomes"])
+    return snapshots
+
+
+def cache_module_outcomes(module: str, snapshot: dict) -> dict:
+    """Write a module's outcomes snapshot and return its incremental cache entry."""
+    INCREMENTAL_DIR.mkdir(parents=True, exist_ok=True)
+    path = INCREMENTAL_DIR / f"{module}.json"
+    with open(path, "w") as f:
+        json.dump(snapshot, f)
+    if snapshot["missed"]:
+        returncode = 2
+    elif snapshot["timeout"]:
+        returncode = 3
+    else:
+        returncode = 0
+    return {
+        "hash": module_hash(module),
+        "outcomes": str(path.relative_to(SRC_DIR)),
+        "score": round(mutation_score(snapshot["caught"], snapshot["missed"], snapshot["timeout"]), 2),
+        "returncode": returncode,
+        "timestamp": datetime.now().isoformat(),
+    }
+
+
+def dedupe_modules(modules) -> list[str]:
+    """Drop unknown modules and modules whose resolved files another selected module covers."""
+    selected, seen = [], {}
+    for mod in modules:
+        if mod not in MODULES:
+            print(f"Warning: unknown module '{mod}' ignored (see --list).")
+            continue
+        key = frozenset(module_source_files(mod)) or frozenset(MODULES[mod]["files"])
+        if key in seen:
+            print(f"Skipping '{mod}': same files as '{seen[key]}'.")
+            continue
+        seen[key] = mod
+        selected.append(mod)
+    return selected
+
+
+def stream_mutants(cmd, env, fail_fast=False, cwd=None) -> int:
+    """Run cargo mutants, echoing its output line by line as it arrives.
+
+    Outcome lines (MISSED/TIMEOUT, plus caught/unviable with -v) are tallied
+    live; with fail_fast the run is stopped at the first MISSED mutant.
+    outcomes.json stays the source of truth for the final summary.
+
+    The pipe is read in binary and echoed byte-for-byte, so cargo's output is
+    never decoded and re-encoded; only the leading word is compared, as bytes.
+    Piping stdout turns off cargo-mutants' TTY progress display, so this is
+    only used when the output has to be watched (--fail-fast).
+
+    The stop is a SIGINT, which cargo-mutants handles like Ctrl+C: it stops
+    its cargo test children, removes its scratch copies, and writes
+    outcomes.json. Its remaining output is still drained, and it is killed
+    if it has not exited within FAIL_FAST_STOP_GRACE_SECONDS.
+    """
+    tally = Counter()
+    out = sys.stdout.buffer
+    sys.stdout.flush()
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, cwd=cwd, env=env)
+    killer = None
+    try:
+        for line in proc.stdout:
+            out.write(line)
+            out.flush()
+            if killer is not None:
+                continue
+            word = line.split(None, 1)[0] if line.strip() else b""
+            if word in LIVE_OUTCOME_WORDS:
+                tally[word] += 1
+            if fail_fast and word == b"MISSED":
+                print("\n--fail-fast: stopping at the first surviving mutant.")
+                sys.stdout.flush()
+                proc.send_signal(signal.SIGINT)
+                killer = threading.Timer(FAIL_FAST_STOP_GRACE_SECONDS, proc.kill)
+                killer.daemon = True
+                killer.start()
+        try:
+            returncode = proc.wait(timeout=FAIL_FAST_STOP_GRACE_SECONDS)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            returncode = proc.wait()
+    except BaseException:
+        proc.kill()
+        proc.wait()
+        raise
+    finally:
+        if killer is not None:
+            killer.cancel()
+        proc.stdout.close()
+        if tally:
+            print(
+                "Live tally: "
+                + ", ".join(f"{word.decode()} {count}" for word, count in sorted(tally.items()))
+            )
+    # Match cargo-mutants' exit code for missed mutants, whatever the interrupt returned.
+    return 2 if killer is not None else returncode
+
+
+@functools.lru_cache(maxsize=None)
+def file_args_for(modules: tuple[str, ...]) -> tuple[str, ...]:
+    """Return the flattened ("-f", pattern, ...) filter args for a module selection."""
+    args = []
     for mod in modules:
         if mod in MODULES:
-            for f in MODULES[mod]["files"]:
-                file_args.extend(["-f", f])
+            for pattern in MODULES[mod]["files"]:
+                args.extend(["-f", pattern])
+    return tuple(args)
+
+
+def run_mutants(
+    modules,
+    timeout=300,
+    cargo_home=None,
+    cargo_target_dir=None,
+    offline=False,
+    shard=None,
+    jobs=None,
+    fail_fast=False,
+    tmpfs=True,
+    output_dir=None,
+    skip_baseline=False,
+):
+    """Run cargo mutants on selected modules.
+
+    Results go to output_dir (default: the shard's dir when sharded, else mutants.out).
+    skip_baseline drops the unmutated build + test when an earlier run already passed it.
+    """
+    # Build file filter args
+    file_args = list(file_args_for(tuple(modules)))
 
     if not file_args:
         print("No valid modules selected.")
         return None
 
+    # Shards get their own output root so parallel jobs never share a directory.
+    output_root = str(output_dir or (shard_output_dir(shard) if shard else OUTPUT_DIR))
     cmd = [
         "cargo", "mutants",
         "--timeout", str(timeout),
-        "-o", "mutants.out",
+        "-o", output_root,
         "--json",
     ] + file_args
     if shard:
-        cmd.extend(["--shard", shard])
+        cmd.extend(cargo_shard_args(shard))
+    if jobs:
+        cmd.extend(["-j", str(jobs)])
+    if skip_baseline:
+        cmd.append("--baseline=skip")
 
     print(f"\nRunning mutation tests on: {', '.join(modules)}")
     if shard:
@@ -312,11 +812,12 @@ def run_mutants(modules, timeout=300, cargo_home=None, cargo_target_dir=None, of
     print(f"Command: {' '.join(cmd)}\n")
     print("-" * 60)
 
-    env = os.environ.copy()
+    # Only the overrides are collected; the environment is copied only if there are any.
+    env_overrides = {}
     if cargo_home:
         cargo_home_path = Path(cargo_home).expanduser()
         cargo_home_path.mkdir(parents=True, exist_ok=True)
-        env["CARGO_HOME"] = str(cargo_home_path)
+        env_overrides["CARGO_HOME"] = str(cargo_home_path)
         if offline and not cargo_home_has_cache(cargo_home_path):
             print(
                 f"Warning: CARGO_HOME {cargo_home_path} looks empty while offline. "
@@ -325,70 +826,111 @@ def run_mutants(modules, timeout=300, cargo_home=None, cargo_target_dir=None, of
     if cargo_target_dir:
         cargo_target_path = Path(cargo_target_dir).expanduser()
         cargo_target_path.mkdir(parents=True, exist_ok=True)
-        env["CARGO_TARGET_DIR"] = str(cargo_target_path)
+        env_overrides["CARGO_TARGET_DIR"] = str(cargo_target_path)
     if offline:
-        env["CARGO_NET_OFFLINE"] = "true"
-
-    os.chdir(SRC_DIR)
-    result = subprocess.run(cmd, capture_output=False, env=env)
-
-    return result.returncode
+        env_overrides["CARGO_NET_OFFLINE"] = "true"
+    # RAM-backed scratch space by default, whenever /dev/shm and free RAM can hold every worker.
+    scratch_dir = tmpfs_scratch_dir(jobs or 1, cargo_target_dir) if tmpfs else None
+    if scratch_dir:
+        env_overrides["TMPDIR"] = str(scratch_dir)
+        print(f"Using tmpfs scratch dir: {scratch_dir}")
+    if jobs and jobs > 1 and (env_overrides.get("CARGO_TARGET_DIR") or os.environ.get("CARGO_TARGET_DIR")):
+        print(
+            f"Warning: CARGO_TARGET_DIR is set while running {jobs} jobs. cargo-mutants "
+            "workers build in separate scratch trees; a shared target dir serializes them on cargo's lock."
+        )
+    env = {**os.environ, **env_overrides} if env_overrides else None
 
+    # cwd instead of os.chdir: keeps the caller's cwd (e.g. a relative --plot-output) intact.
+    if fail_fast:
+        return stream_mutants(cmd, env, fail_fast=True, cwd=SRC_DIR)
+    # Inherit stdout so cargo-mutants keeps its interactive progress display on a TTY.
+    sys.stdout.flush()
+    return subprocess.run(cmd, cwd=SRC_DIR, env=env).returncode
 
-def parse_results():
-    """Parse mutation testing results."""
-    outcomes_file = find_latest_outcomes_file()
 
-    if outcomes_file is None:
-        print(f"No results found under {OUTPUT_DIR}")
-        return None
+def load_outcomes(outcomes_file: Path) -> tuple[dict, object]:
+    """Return (data, outcomes) for an outcomes.json.
 
+    Large files are streamed with ijson.items when it is installed; data is
+    then empty and parse_results counts the outcomes itself.
+    """
+    if ijson is not None and outcomes_file.stat().st_size >= STREAM_PARSE_MIN_BYTES:
+        return {}, stream_outcomes(outcomes_file)
     with open(outcomes_file) as f:
         data = json.load(f)
+    return data, data.get("outcomes", [])
 
-    outcomes = data.get("outcomes", [])
 
-    # Prefer top-level counters from cargo-mutants when available.
-    stats = {
-        "killed": int(data.get("caught", 0)),
-        "survived": int(data.get("missed", 0)),
-        "timeout": int(data.get("timeout", 0)),
-        "unviable": int(data.get("unviable", 0)),
-        "total": int(data.get("total_mutants", len(outcomes))),
-    }
+def stream_outcomes(outcomes_file: Path):
+    """Yield outcomes one at a time without holding the whole file in memory."""
+    with open(outcomes_file, "rb") as f:
+        yield from ijson.items(f, "outcomes.item")
+
+
+def parse_results(outcomes_file: Optional[Path] = None, merged: bool = False, sources=None):
+    """Parse mutation testing results.
+
+    Reads outcomes_file (default: the newest outcomes.json), the concatenation
+    of the sources outcomes files, or with merged=True every shard's outcomes.
+    """
+    if sources is not None or merged:
+        data = merge_outcomes(sources) if sources is not None else merge_shards()
+        if data is None:
+            print(f"No {'shard ' if merged else ''}results found under {OUTPUT_DIR}")
+            return None
+        outcomes = data.get("outcomes", [])
+        outcomes_label = f"merged {len(data['merged_files'])} {'shard' if merged else 'outcomes file'}(s)"
+        results_dir = OUTPUT_DIR
+    else:
+        if outcomes_file is None:
+            outcomes_file = find_latest_outcomes_file(OUTPUT_DIR)
+        if outcomes_file is None:
+            print(f"No results found under {OUTPUT_DIR}")
+            return None
+        data, outcomes = load_outcomes(outcomes_file)
+        outcomes_label = str(outcomes_file)
+        results_dir = outcomes_file.parent
+
     fallback = {"killed": 0, "survived": 0, "timeout": 0, "unviable": 0}
+    outcome_count = 0
 
     survived_mutants = []
     survived_by_file = Counter()
     survived_by_dir = Counter()
 
+    status_keys = STATUS_KEYS
     for outcome in outcomes:
-        status = outcome.get("summary", "unknown")
-
-        if status in CAUGHT_SUMMARIES:
-            fallback["killed"] += 1
-        elif status in MISSED_SUMMARIES:
-            fallback["survived"] += 1
+        outcome_count += 1
+        key = status_keys.get(outcome.get("summary"))
+        if key is None:
+            continue
+        fallback[key] += 1
+        if key == "survived":
             fields = scenario_fields(outcome)
             file_path = fields["file"]
             survived_mutants.append(fields)
             survived_by_file[file_path] += 1
-            survived_by_dir[str(Path(file_path).parent)] += 1
-        elif status in TIMEOUT_SUMMARIES:
-            fallback["timeout"] += 1
-        elif status in UNVIABLE_SUMMARIES:
-            fallback["unviable"] += 1
+            # cargo-mutants always writes "/" separators, so no pathlib needed.
+            survived_by_dir[file_path.rpartition("/")[0] or "."] += 1
 
+    # Prefer top-level counters from cargo-mutants when available.
+    stats = {
+        "killed": int(data.get("caught", 0)),
+        "survived": int(data.get("missed", 0)),
+        "timeout": int(data.get("timeout", 0)),
+        "unviable": int(data.get("unviable", 0)),
+        "total": int(data.get("total_mutants", outcome_count)),
+    }
     if stats["total"] == 0:
-        stats["total"] = len(outcomes)
+        stats["total"] = outcome_count
 
     # Backward-compat fallback when top-level counters are absent.
     if (stats["killed"] + stats["survived"] + stats["timeout"] + stats["unviable"]) == 0:
         stats.update(fallback)
 
     # Calculate score
-    testable = stats["killed"] + stats["survived"] + stats["timeout"]
-    score = (stats["killed"] / testable * 100) if testable > 0 else 0
+    score = mutation_score(stats["killed"], stats["survived"], stats["timeout"])
 
     return {
         "stats": stats,
@@ -396,8 +938,8 @@ def parse_results():
         "survived": survived_mutants,
         "survived_by_file": survived_by_file,
         "survived_by_dir": survived_by_dir,
-        "outcomes_path": str(outcomes_file),
-        "results_dir": str(outcomes_file.parent),
+        "outcomes_path": outcomes_label,
+        "results_dir": str(results_dir),
         "timestamp": datetime.now().isoformat(),
     }
 
@@ -422,6 +964,10 @@ def output_results(results, format="markdown", top_n=5):
         print(json.dumps(json_results, indent=2))
         return
 
+    # Computed once; shared by the stdout tables and summary.md.
+    top_files = survived_by_file.most_common(top_n)
+    top_dirs = survived_by_dir.most_common(top_n)
+
     # Markdown format (AI-readable)
     print("\n" + "=" * 60)
     print("MUTATION TESTING RESULTS")
@@ -459,35 +1005,35 @@ Outcomes: {outcomes_path}
         print("\n## Top Files by Survived Mutants\n")
         print("| File | Survived |")
         print("|------|----------|")
-        for file_path, count in survived_by_file.most_common(top_n):
+        for file_path, count in top_files:
             print(f"| {file_path} | {count} |")
 
         print("\n## Top Directories by Survived Mutants\n")
         print("| Directory | Survived |")
         print("|-----------|----------|")
-        for dir_path, count in survived_by_dir.most_common(top_n):
+        for dir_path, count in top_dirs:
             print(f"| {dir_path} | {count} |")
 
     print()
 
     # Save to file
     output_file = OUTPUT_DIR / "summary.md"
-    with open(output_file, "w") as f:
-        f.write(f"# Mutation Testing Results\n\n")
-        f.write(f"Generated: {results['timestamp']}\n\n")
-        f.write(f"## Score: {score:.1f}%\n\n")
-        f.write(f"- Killed: {stats['killed']}\n")
-        f.write(f"- Survived: {stats['survived']}\n")
-        f.write(f"- Total: {stats['total']}\n")
-        f.write(f"- Results dir: {results_dir}\n")
-        f.write(f"- Outcomes: {outcomes_path}\n\n")
-        if survived:
-            f.write("## Top Files by Survived Mutants\n\n")
-            for file_path, count in survived_by_file.most_common(top_n):
-                f.write(f"- {file_path}: {count}\n")
-            f.write("\n## Top Directories by Survived Mutants\n\n")
-            for dir_path, count in survived_by_dir.most_common(top_n):
-                f.write(f"- {dir_path}: {count}\n")
+    parts = [
+        "# Mutation Testing Results\n\n",
+        f"Generated: {results['timestamp']}\n\n",
+        f"## Score: {score:.1f}%\n\n",
+        f"- Killed: {stats['killed']}\n",
+        f"- Survived: {stats['survived']}\n",
+        f"- Total: {stats['total']}\n",
+        f"- Results dir: {results_dir}\n",
+        f"- Outcomes: {outcomes_path}\n\n",
+    ]
+    if survived:
+        parts.append("## Top Files by Survived Mutants\n\n")
+        parts.extend(f"- {file_path}: {count}\n" for file_path, count in top_files)
+        parts.append("\n## Top Directories by Survived Mutants\n\n")
+        parts.extend(f"- {dir_path}: {count}\n" for dir_path, count in top_dirs)
+    output_file.write_text("".join(parts))
 
     print(f"Results saved to: {output_file}")
 
@@ -504,7 +1050,43 @@ def main():
     parser.add_argument("--offline", action="store_true", help="Set CARGO_NET_OFFLINE=true")
     parser.add_argument("--cargo-home", help="Override CARGO_HOME for cargo mutants")
     parser.add_argument("--cargo-target-dir", help="Override CARGO_TARGET_DIR for cargo mutants")
-    parser.add_argument("--shard", help="Run one shard, e.g. 1/8")
+    parser.add_argument("--shard", help="Run one shard, e.g. 1/8 (1-based)")
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=default_jobs(),
+        help="Parallel cargo-mutants workers (default: half the CPUs)",
+    )
+    parser.add_argument(
+        "--merge-shards",
+        action="store_true",
+        help="With --results-only, merge outcomes from every shard-* output dir",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help=(
+            "Skip modules whose sources, Cargo.toml, and Cargo.lock are unchanged since their "
+            "last completed run (tests in other modules are not tracked)"
+        ),
+    )
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help=(
+            "Test modules one at a time, prior survivors first, and stop at the first "
+            "surviving mutant"
+        ),
+    )
+    parser.add_argument(
+        "--no-tmpfs",
+        action="store_true",
+        help=(
+            "Keep cargo-mutants scratch builds off /dev/shm (by default they go there when it "
+            "and free RAM can hold jobs x the source + target size)"
+        ),
+    )
     parser.add_argument("--top", type=int, default=5, help="Top N paths to summarize")
     parser.add_argument("--plot", action="store_true", help="Render a matplotlib hotspot plot")
     parser.add_argument(
@@ -521,6 +1103,11 @@ def main():
     )
     parser.add_argument("--plot-output", help="Output path for the plot image")
     parser.add_argument("--plot-show", action="store_true", help="Display the plot window")
+    parser.add_argument(
+        "--plot-async",
+        action="store_true",
+        help="Write the plot image from a background process",
+    )
 
     args = parser.parse_args()
 
@@ -529,7 +1116,7 @@ def main():
         return
 
     if args.results_only:
-        results = parse_results()
+        results = parse_results(merged=args.merge_shards)
         output_results(results, "json" if args.json else "markdown", top_n=args.top)
         if args.plot:
             plot_hotspots(
@@ -538,6 +1125,7 @@ def main():
                 args.plot_top_pct,
                 args.plot_output,
                 args.plot_show,
+                async_save=args.plot_async,
             )
         return
 
@@ -549,6 +1137,10 @@ def main():
     else:
         modules = select_modules_interactive()
 
+    modules = dedupe_modules(modules)
+    if not modules:
+        print("No valid modules selected.")
+        sys.exit(2)
     print(f"\nSelected modules: {', '.join(modules)}")
 
     try:
@@ -556,19 +1148,133 @@ def main():
     except ValueError as exc:
         print(f"ERROR: {exc}")
         sys.exit(2)
+    if args.jobs < 1:
+        print("ERROR: --jobs must be at least 1.")
+        sys.exit(2)
+    if shard and args.fail_fast:
+        # --fail-fast gives every module its own output root; a shard needs a single one.
+        print("ERROR: --fail-fast cannot be combined with --shard.")
+        sys.exit(2)
 
-    # Run mutation tests
-    returncode = run_mutants(
-        modules,
-        args.timeout,
-        cargo_home=args.cargo_home,
-        cargo_target_dir=args.cargo_target_dir,
-        offline=args.offline,
-        shard=shard,
-    )
-
-    # Parse and output results
-    results = parse_results()
+    # A shard only covers part of each module, so it neither uses nor fills the cache.
+    incremental = args.incremental and not shard
+    if args.incremental and shard:
+        print("Note: --incremental is ignored with --shard.")
+    cache = load_cache() if incremental else {}
+    unchanged = []
+    if incremental:
+        modules, unchanged = split_cached_modules(modules, cache)
+        if unchanged:
+            print(f"Skipping unchanged modules (incremental): {', '.join(unchanged)}")
+
+    # Defect-first: modules with survivors last time (or never tested) go first.
+    modules = order_modules_by_priority(modules, load_priority())
+
+    # Run mutation tests; reported_modules are the ones outcome_files cover, and
+    # completed maps each fully tested module to the outcomes file it landed in.
+    reported_modules = modules
+    outcome_files = []
+    completed = {}
+    if modules and args.fail_fast:
+        # cargo-mutants walks the tree in its own order, so one invocation per
+        # module is what makes the priority order (and the early stop) take effect.
+        # Each module writes its own output root; the report merges all of them.
+        reported_modules = []
+        timed_out = False
+        for mod in modules:
+            output_dir = module_output_dir(mod)
+            shutil.rmtree(output_dir, ignore_errors=True)
+            returncode = run_mutants(
+                [mod],
+                args.timeout,
+                cargo_home=args.cargo_home,
+                cargo_target_dir=args.cargo_target_dir,
+                offline=args.offline,
+                jobs=args.jobs,
+                tmpfs=not args.no_tmpfs,
+                fail_fast=True,
+                output_dir=output_dir,
+                # The tree is unmutated for every module, so one passing baseline is enough.
+                skip_baseline=bool(reported_modules),
+            )
+            outcomes_file = latest_outcomes_in(output_dir)
+            if outcomes_file is None:
+                print(f"Warning: no outcomes.json written for module '{mod}' under {output_dir}")
+            else:
+                reported_modules.append(mod)
+                outcome_files.append(outcomes_file)
+                # 2 here means stream_mutants stopped at a survivor, so the outcomes are partial.
+                if returncode in COMPLETED_RETURNCODES - {2}:
+                    completed[mod] = outcomes_file
+            if returncode == 2:
+                break
+            if returncode not in COMPLETED_RETURNCODES:
+                # Not a survivor: the baseline, the build, or cargo-mutants itself failed.
+                print(f"ERROR: cargo mutants failed for module '{mod}' (exit {returncode}).")
+                break
+            # Timeouts are not survivors: remember them for the exit code and keep going.
+            timed_out = timed_out or returncode == 3
+        if returncode == 0 and timed_out:
+            returncode = 3
+    elif modules:
+        output_dir = shard_output_dir(shard) if shard else OUTPUT_DIR
+        returncode = run_mutants(
+            modules,
+            args.timeout,
+            cargo_home=args.cargo_home,
+            cargo_target_dir=args.cargo_target_dir,
+            offline=args.offline,
+            shard=shard,
+            jobs=args.jobs,
+            tmpfs=not args.no_tmpfs,
+            output_dir=output_dir,
+        )
+        outcomes_file = latest_outcomes_in(output_dir)
+        if outcomes_file is None:
+            # Never fall back to another run's outcomes: they would be reported as this run's.
+            print(f"ERROR: no outcomes.json written under {output_dir}")
+            sys.exit(2)
+        outcome_files.append(outcomes_file)
+        if returncode in COMPLETED_RETURNCODES:
+            completed = dict.fromkeys(modules, outcomes_file)
+    else:
+        print("All selected modules are unchanged since their last run; showing previous results.")
+        returncode = 0
+
+    if incremental and completed:
+        # Each outcomes file is read once, however many modules it covers.
+        by_file = {}
+        for mod, outcomes_file in completed.items():
+            by_file.setdefault(outcomes_file, []).append(mod)
+        for outcomes_file, file_modules in by_file.items():
+            _, outcomes = load_outcomes(outcomes_file)
+            for mod, snapshot in split_outcomes_by_module(file_modules, outcomes).items():
+                cache[mod] = cache_module_outcomes(mod, snapshot)
+        save_cache(cache)
+
+    # Skipped modules are reported from their cached snapshots, next to this run's outcomes.
+    for mod in unchanged:
+        outcome_files.append(cached_outcomes_file(cache[mod]))
+    reported_modules = reported_modules + unchanged
+    if returncode == 0:
+        returncode = next((cache[mod]["returncode"] for mod in unchanged if cache[mod].get("returncode")), 0)
+
+    # Parse and output results (only this run's files; never the newest file on disk)
+    if len(outcome_files) > 1:
+        # Write the merged set back to the default output root so a later
+        # --results-only reports every module, not just the freshly run ones.
+        merged = merge_outcomes(outcome_files)
+        REPORT_OUTCOMES_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(REPORT_OUTCOMES_FILE, "w") as f:
+            json.dump(merged, f)
+        results = parse_results(REPORT_OUTCOMES_FILE)
+    elif outcome_files:
+        results = parse_results(outcome_files[0])
+    else:
+        print("No outcomes.json was written by this run.")
+        results = None
+    if results and reported_modules and not shard and returncode in COMPLETED_RETURNCODES:
+        save_priority(reported_modules, results)
     output_results(results, "json" if args.json else "markdown", top_n=args.top)
     if args.plot:
         plot_hotspots(
@@ -577,6 +1283,7 @@ def main():
             args.plot_top_pct,
             args.plot_output,
             args.plot_show,
+            async_save=args.plot_async,
         )
 
     # Exit with appropriate code
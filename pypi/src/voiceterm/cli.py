@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import os
 import shutil
+import stat
 import subprocess
 import sys
 import tempfile
@@ -27,6 +28,14 @@ def _native_bin() -> Path:
     return _native_root() / "bin" / "voiceterm"
 
 
+def _is_regular_file(path: Path) -> bool:
+    # One stat() call; a directory or dangling path at the binary location is not usable.
+    try:
+        return stat.S_ISREG(os.stat(path).st_mode)
+    except OSError:
+        return False
+
+
 def _run(cmd: list[str], *, check: bool = True) -> subprocess.CompletedProcess[str]:
     return subprocess.run(cmd, check=check, text=True)
 
@@ -73,14 +82,14 @@ def _bootstrap_native_bin() -> Path:
         )
 
     native = _native_bin()
-    if not native.exists():
+    if not _is_regular_file(native):
         raise RuntimeError(f"Bootstrap completed but binary was not found at {native}.")
     return native
 
 
 def _ensure_native_bin() -> Path:
     native = _native_bin()
-    if native.exists():
+    if _is_regular_file(native):
         return native
     return _bootstrap_native_bin()
 
@@ -96,8 +105,18 @@ def main() -> int:
         )
         return 1
 
+    argv = [str(native), *sys.argv[1:]]
+    if os.name == "posix":
+        # Replace the launcher so the interpreter is not kept resident for the
+        # whole session; signals and the exit status go straight to voiceterm.
+        try:
+            os.execv(argv[0], argv)
+        except OSError as err:
+            print(f"voiceterm launcher error: cannot execute {native}: {err}", file=sys.stderr)
+            return 126
+
     try:
-        completed = subprocess.run([str(native), *sys.argv[1:]])
+        completed = subprocess.run(argv)
         return int(completed.returncode)
     except KeyboardInterrupt:
         return 130
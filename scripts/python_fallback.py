@@ -15,137 +15,371 @@ so frontends such as the Rust TUI or automated tests can run the pipeline
 non-interactively (`--auto-send --emit-json`) and treat this script as the
 canonical spec.
 """
-import argparse, errno, json, os, platform, pty, select, shlex, shutil, subprocess, sys, tempfile, time
+import argparse, errno, functools, io, json, os, platform, pty, re, select, shlex, shutil, signal, subprocess, sys, tempfile, threading, time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Callable, Optional
 
+try:
+    import orjson  # Optional: faster --emit-json serialization when installed.
+except ImportError:
+    orjson = None
+
 # Extra Codex CLI flags injected via --codex-args/--codex-arg; stored globally for reuse.
-_EXTRA_CODEX_ARGS: list[str] = []
+_EXTRA_CODEX_ARGS: tuple[str, ...] = ()
 
-def _require(cmd: str):
-    """Ensure a command is present on the PATH before dispatching a subprocess.
+# Codex invocation mode that last succeeded ("arg", "stdin", "arg_pty", "stdin_pty").
+# Tried first on the next call so repeat turns skip attempts known to fail.
+_LAST_GOOD_CODEX_MODE: str | None = None
+
+# Cursor-position query some CLIs emit on a PTY, and the fixed reply we send back.
+_CURSOR_QUERY = b"\x1b[6n"
+_CURSOR_REPORT = b"\x1b[1;1R"
+
+@functools.lru_cache(maxsize=32)
+def _resolve(cmd: str) -> str:
+    """Return the absolute path `shutil.which` finds for `cmd`, memoized per process.
+
+    Each pipeline stage checks its tool before spawning, so caching avoids
+    rescanning PATH on every clip. Call `_resolve.cache_clear()` after PATH
+    changes. Failed lookups raise and are therefore never cached.
 
     Raises:
         RuntimeError: if the command cannot be found with `shutil.which`.
     """
-    if shutil.which(cmd) is None:
+    path = shutil.which(cmd)
+    if path is None:
         raise RuntimeError(f"Command not found on PATH: {cmd}")
+    return path
+
+@functools.lru_cache(maxsize=1)
+def _codex_env() -> dict[str, str]:
+    """Return the environment block for Codex children, built once per process.
+
+    Copies `os.environ` with a `TERM` default so TTY-aware CLIs render sanely.
+    subprocess never mutates the mapping, so every spawn shares it; call
+    `_codex_env.cache_clear()` after changing `os.environ`.
+    """
+    return {**os.environ, "TERM": os.environ.get("TERM", "xterm-256color")}
+
+def _require(cmd: str) -> str:
+    """Ensure a command is present on the PATH before dispatching a subprocess.
+
+    Returns:
+        The resolved absolute path of the command.
+
+    Raises:
+        RuntimeError: if the command cannot be found with `shutil.which`.
+    """
+    return _resolve(cmd)
 
 def _run(argv, *, input_bytes=None, timeout=None, cwd=None, env=None):
     """Execute a command and return its stdout bytes.
 
     Args:
-        argv: Sequence passed to `subprocess.Popen`.
+        argv: Sequence passed to `subprocess.run`. A bare command name in
+            `argv[0]` is resolved through the cached `_resolve` lookup.
         input_bytes: Optional stdin payload supplied once, with a newline added
             by the caller when required.
         timeout: Optional ceiling in seconds before the subprocess is killed.
         cwd: Optional working directory override.
         env: Optional environment block for the child process.
 
+    Passing an absolute executable and leaving `close_fds` off keeps CPython on
+    its `posix_spawn` fast path whenever `cwd` is not set. Descriptors opened
+    by Python are non-inheritable by default (PEP 446), so nothing extra
+    leaks into the child.
+
     Raises:
         RuntimeError: if the command times out or exits non-zero. The error
         includes stderr output so failures are easier to diagnose.
     """
-    p = subprocess.Popen(argv, stdin=subprocess.PIPE if input_bytes else None,
-                         stdout=subprocess.PIPE, stderr=subprocess.PIPE, cwd=cwd, env=env)
+    executable = argv[0]
+    if not os.path.dirname(executable):
+        executable = _resolve(executable)
+    # stderr lands in an unnamed temp file and is only read on failure, so
+    # successful runs drain a single pipe.
+    with tempfile.TemporaryFile() as err_file:
+        try:
+            p = subprocess.run(
+                [executable, *argv[1:]],
+                input=input_bytes or None,
+                stdout=subprocess.PIPE,
+                stderr=err_file,
+                timeout=timeout,
+                cwd=cwd,
+                env=env,
+                close_fds=cwd is not None,
+                check=False,
+            )
+        except subprocess.TimeoutExpired:
+            err_file.seek(0)
+            raise RuntimeError(f"Timeout running: {' '.join(argv)}\n{err_file.read().decode(errors='ignore')}")
+        if p.returncode != 0:
+            err_file.seek(0)
+            raise RuntimeError(f"Nonzero exit {p.returncode}: {' '.join(argv)}\n{err_file.read().decode(errors='ignore')}")
+    return p.stdout
+
+class _CursorReportFilter:
+    """Strip `ESC[6n` cursor-position queries from a PTY stream in one pass.
+
+    `state` counts how many query bytes were matched at the end of the last
+    chunk, so a query split across two reads is still removed. Matching uses
+    `bytes.find` and copies the surrounding bytes straight into the caller's
+    output buffer without building intermediate chunks.
+    """
+
+    def __init__(self) -> None:
+        self.state = 0
+
+    def feed(self, data, out: bytearray, size: int | None = None) -> int:
+        """Append `data[:size]` minus any queries to `out`; return the number removed.
+
+        `size` lets callers pass a reused read buffer without slicing it.
+        """
+        query = _CURSOR_QUERY
+        view = memoryview(data)
+        if size is None:
+            size = len(data)
+        if not self.state and data.find(b"\x1b", 0, size) < 0:
+            # Common case, plain output: one memchr-style scan and a single copy.
+            out += view[:size]
+            return 0
+        found = 0
+        pos = 0
+        if self.state:
+            need = query[self.state:]
+            take = min(len(need), size)
+            if view[:take] == need[:take]:
+                if take < len(need):
+                    self.state += take
+                    return 0
+                found += 1
+                pos = take
+            else:
+                out += query[:self.state]
+            self.state = 0
+        while True:
+            idx = data.find(query, pos, size)
+            if idx < 0:
+                break
+            out += view[pos:idx]
+            found += 1
+            pos = idx + len(query)
+        # Hold back a trailing partial query until the next chunk arrives.
+        esc = data.rfind(b"\x1b", max(pos, size - len(query) + 1), size)
+        if esc >= 0 and query.startswith(view[esc:size]):
+            out += view[pos:esc]
+            self.state = size - esc
+        else:
+            out += view[pos:size]
+        return found
+
+    def flush(self, out: bytearray) -> None:
+        """Emit any held-back partial query once the stream has ended."""
+        if self.state:
+            out += _CURSOR_QUERY[:self.state]
+            self.state = 0
+
+def _install_sigchld_wakeup():
+    """Route SIGCHLD into a self-pipe so `select` wakes as soon as a child exits.
+
+    Returns `(read_fd, write_fd, previous_handler)`, or None when signal
+    handlers cannot be installed (non-main thread or no SIGCHLD support). The
+    caller must pass the tuple to `_remove_sigchld_wakeup` once done.
+    """
+    if not hasattr(signal, "SIGCHLD") or threading.current_thread() is not threading.main_thread():
+        return None
+    wake_r, wake_w = os.pipe()
+    os.set_blocking(wake_r, False)
+    os.set_blocking(wake_w, False)
+
+    def _on_sigchld(signum, frame):
+        try:
+            os.write(wake_w, b"\0")
+        except OSError:
+            # Pipe full means a wakeup is already pending.
+            pass
+
     try:
-        out, err = p.communicate(input=input_bytes, timeout=timeout)
-    except subprocess.TimeoutExpired:
-        p.kill()
-        out, err = p.communicate()
-        raise RuntimeError(f"Timeout running: {' '.join(argv)}\n{err.decode(errors='ignore')}")
-    if p.returncode != 0:
-        raise RuntimeError(f"Nonzero exit {p.returncode}: {' '.join(argv)}\n{err.decode(errors='ignore')}")
-    return out
-
-def _run_with_pty(argv, *, input_bytes=None, timeout=None, env=None):
+        previous = signal.signal(signal.SIGCHLD, _on_sigchld)
+    except (OSError, ValueError):
+        os.close(wake_r)
+        os.close(wake_w)
+        return None
+    return wake_r, wake_w, previous
+
+def _remove_sigchld_wakeup(wakeup) -> None:
+    """Restore the previous SIGCHLD handler and close the self-pipe."""
+    if wakeup is None:
+        return
+    wake_r, wake_w, previous = wakeup
+    signal.signal(signal.SIGCHLD, previous if previous is not None else signal.SIG_DFL)
+    os.close(wake_r)
+    os.close(wake_w)
+
+def _run_with_pty(argv, *, input_bytes=None, timeout=None, env=None, sink=None):
     """Run a command within a pseudo-terminal and capture its output.
 
     Some Codex CLI flows emit a "stdout is not a TTY" error when started from a
     non-interactive pipe. In those situations we fall back to a PTY so the CLI
     believes it is talking to a terminal.
+
+    The read loop blocks until output arrives, the child exits, or the timeout
+    elapses instead of polling on a fixed interval. Child exit is signalled by
+    a pidfd on Linux (any thread), else by a SIGCHLD self-pipe; off the main
+    thread without pidfd support it falls back to polling every 100 ms.
+
+    When `sink` (a binary writable) is given, output is forwarded to it as it
+    arrives instead of being buffered, and the number of bytes forwarded is
+    returned in place of the captured output.
     """
     if platform.system() == "Windows":
         raise RuntimeError("PTY fallback is not supported on Windows")
 
+    # Absolute path + inherited fds keep Popen on its posix_spawn/vfork path (as in
+    # `_run`); the PTY, wakeup pipe and pidfd are all non-inheritable (PEP 446).
+    executable = _resolve(argv[0])
     master_fd, slave_fd = pty.openpty()
-    cursor_report = b"\x1b[1;1R"
+    # A pidfd needs no signal handler; otherwise install the SIGCHLD pipe before
+    # spawning so an early exit still leaves a wakeup byte behind.
+    use_pidfd = hasattr(os, "pidfd_open")
+    wakeup = None if use_pidfd else _install_sigchld_wakeup()
     proc = None
     try:
-        proc = subprocess.Popen(argv, stdin=slave_fd, stdout=slave_fd, stderr=slave_fd, env=env)
+        proc = subprocess.Popen([executable, *argv[1:]], stdin=slave_fd, stdout=slave_fd, stderr=slave_fd,
+                                env=env, close_fds=False)
     except Exception:
         os.close(master_fd)
         os.close(slave_fd)
+        _remove_sigchld_wakeup(wakeup)
         raise
     finally:
         # Child inherits the slave; close our parent copy.
         if proc is not None:
             os.close(slave_fd)
 
+    pidfd = None
+    if use_pidfd:
+        try:
+            # Becomes readable once the child exits; works from any thread.
+            pidfd = os.pidfd_open(proc.pid)
+        except OSError:
+            # Kernel without pidfd support (< 5.3): poll below.
+            pass
+    wake_r = pidfd if pidfd is not None else (wakeup[0] if wakeup is not None else None)
+
     if input_bytes:
         data = input_bytes
         if not data.endswith(b"\n"):
             data += b"\n"
         os.write(master_fd, data)
 
+    # Non-blocking so each wakeup drains the whole burst in a few large reads.
+    os.set_blocking(master_fd, False)
+    # Captured output, or a per-burst scratch buffer when streaming to `sink`.
     out = bytearray()
-    start = time.monotonic()
-
-    def _read_chunk():
-        try:
-            return os.read(master_fd, 1024)
-        except OSError as e:
-            if e.errno == errno.EIO:
-                return b""
-            raise
+    forwarded = 0
+    deadline = time.monotonic() + timeout if timeout is not None else None
+    # Set once the slave side is closed; select would otherwise spin on EIO.
+    master_eof = False
+
+    cursor_filter = _CursorReportFilter()
+    # Reused for every read: the kernel fills it in place and the filter copies
+    # straight from it into `out`, so no bytes object is allocated per chunk.
+    read_buf = bytearray(65536)
+    reader = io.FileIO(master_fd, "rb", closefd=False)
+
+    def _forward():
+        nonlocal forwarded
+        if sink is not None and out:
+            sink.write(out)
+            sink.flush()
+            forwarded += len(out)
+            out.clear()
+
+    def _drain():
+        """Read everything currently buffered on the master until EAGAIN/EOF.
+
+        Each chunk goes straight through the cursor filter into `out`, so no
+        per-burst copy is made; replies and the sink write happen once per burst.
+        """
+        nonlocal master_eof
+        queries = 0
+        while True:
+            try:
+                n = reader.readinto(read_buf)
+            except OSError as e:
+                if e.errno == errno.EIO:
+                    master_eof = True
+                    break
+                raise
+            if n is None:
+                # EAGAIN on the non-blocking master: the burst is drained.
+                break
+            if not n:
+                master_eof = True
+                break
+            queries += cursor_filter.feed(read_buf, out, n)
+        if queries:
+            os.write(master_fd, _CURSOR_REPORT * queries)
+        _forward()
 
     try:
         while True:
-            if timeout is not None:
-                elapsed = time.monotonic() - start
-                remaining = timeout - elapsed
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
                 if remaining <= 0:
                     proc.kill()
                     proc.wait()
                     raise RuntimeError(f"Timeout running (PTY): {' '.join(argv)}")
-                wait = max(0.0, min(0.1, remaining))
+                wait = remaining
             else:
-                wait = 0.1
-
-            r, _, _ = select.select([master_fd], [], [], wait)
+                wait = None
+            if wake_r is None:
+                wait = 0.1 if wait is None else min(0.1, wait)
+
+            readers = [] if master_eof else [master_fd]
+            if wake_r is not None:
+                readers.append(wake_r)
+            r, _, _ = select.select(readers, [], [], wait)
             if master_fd in r:
-                chunk = _read_chunk()
-                if chunk:
-                    if b"\x1b[6n" in chunk:
-                        chunk = chunk.replace(b"\x1b[6n", b"")
-                        os.write(master_fd, cursor_report)
-                    if chunk:
-                        out.extend(chunk)
-                elif proc.poll() is not None:
-                    break
-            if proc.poll() is not None:
-                while True:
-                    chunk = _read_chunk()
-                    if not chunk:
-                        break
-                    if b"\x1b[6n" in chunk:
-                        chunk = chunk.replace(b"\x1b[6n", b"")
-                        os.write(master_fd, cursor_report)
-                    if chunk:
-                        out.extend(chunk)
+                _drain()
+
+            if wake_r is None:
+                exited = proc.poll() is not None
+            elif wake_r in r:
+                if pidfd is None:
+                    # SIGCHLD may belong to another child; confirm ours is done.
+                    try:
+                        while os.read(wake_r, 64):
+                            pass
+                    except BlockingIOError:
+                        pass
+                exited = proc.poll() is not None
+            else:
+                exited = False
+
+            if exited:
+                _drain()
+                cursor_filter.flush(out)
+                _forward()
                 break
     finally:
         os.close(master_fd)
+        if pidfd is not None:
+            os.close(pidfd)
+        _remove_sigchld_wakeup(wakeup)
 
     if proc.returncode != 0:
         raise RuntimeError(f"Nonzero exit {proc.returncode} (PTY): {' '.join(argv)}\n{out.decode('utf-8', errors='ignore')}")
-    return bytes(out)
+    return bytes(out) if sink is None else forwarded
+
+_TTY_ERR_RE = re.compile(r"stdout is not a terminal|isatty|not a tty", re.IGNORECASE)
 
 def _is_tty_error(error: Exception) -> bool:
     """Return True when the exception text suggests a missing TTY."""
-    msg = str(error).lower()
-    return "stdout is not a terminal" in msg or "isatty" in msg or "not a tty" in msg
+    return _TTY_ERR_RE.search(str(error)) is not None
 
 def record_wav(path: str, seconds: int, ffmpeg_cmd: str, ffmpeg_device: str|None=None) -> None:
     """Capture microphone input to a mono, 16 kHz WAV file via ffmpeg.
@@ -154,9 +388,9 @@ def record_wav(path: str, seconds: int, ffmpeg_cmd: str, ffmpeg_device: str|None
     caller rarely needs to know the exact device names. When defaults do not
     work the optional `ffmpeg_device` argument allows full override.
     """
-    _require(ffmpeg_cmd)
+    ffmpeg_path = _require(ffmpeg_cmd)
     sysname = platform.system()
-    args = [ffmpeg_cmd, "-y"]
+    args = [ffmpeg_path, "-y"]
     if sysname == "Darwin":
         # list devices: ffmpeg -f avfoundation -list_devices true -i ""
         dev = ffmpeg_device if ffmpeg_device else ":0"
@@ -174,73 +408,160 @@ def record_wav(path: str, seconds: int, ffmpeg_cmd: str, ffmpeg_device: str|None
     args += ["-t", str(seconds), "-ac", "1", "-ar", "16000", "-vn", path]
     _run(args)
 
+# Executable names (lowercased basenames) with a known Whisper CLI flavour.
+_OPENAI_WHISPER_NAMES = frozenset({"whisper", "whisper.exe", "whisper-ctranslate2", "faster-whisper"})
+_WHISPER_CPP_NAMES = frozenset({"main", "whisper-cli", "whisper-cli.exe", "whisper-cpp", "whisper.cpp"})
+
+def _is_openai_whisper(exe: str) -> bool:
+    """Return True when `exe` takes OpenAI-whisper flags rather than whisper.cpp flags.
+
+    Known names resolve with a set lookup; anything else that starts with
+    "whisper" and does not mention cpp is assumed to be an OpenAI-style CLI.
+    """
+    if exe in _OPENAI_WHISPER_NAMES:
+        return True
+    if exe in _WHISPER_CPP_NAMES:
+        return False
+    return exe.startswith("whisper") and "cpp" not in exe
+
 def transcribe(path: str, whisper_cmd: str, lang: str, model: str, *, model_path: str|None=None, tmpdir: Path|None=None) -> tuple[str, Path]:
     """Convert recorded audio into text using the selected Whisper implementation.
 
     This helper accepts both the official OpenAI CLI (`whisper`) and the
     whisper.cpp binary, mirroring the flags required by each tool. Temporary
     files are written into a per-invocation directory so that multiple runs
-    never collide.
+    never collide. Paths stay plain strings until the returned `Path`.
     Returns:
         A tuple of the transcript text and the path to the generated `.txt` file.
     """
-    _require(whisper_cmd)
-    tmpdir = Path(tmpdir or tempfile.mkdtemp(prefix="voiceterm_"))
-    base = tmpdir / "transcript"
-    exe = Path(whisper_cmd).name.lower()
+    whisper_path = _require(whisper_cmd)
+    tmpdir = os.fspath(tmpdir or tempfile.mkdtemp(prefix="voiceterm_"))
+    base = os.path.join(tmpdir, "transcript")
+    exe = os.path.basename(whisper_cmd).lower()
 
     lang = lang.strip().lower()
     use_auto = lang == "auto"
 
-    if "whisper" == exe or exe.startswith("whisper"):
+    if _is_openai_whisper(exe):
         # OpenAI whisper CLI
         # Writes <basename>.txt into output_dir
         out_dir = tmpdir
-        args = [whisper_cmd, path, "--model", model, "--output_format", "txt", "--output_dir", str(out_dir)]
+        args = [whisper_path, path, "--model", model, "--output_format", "txt", "--output_dir", out_dir]
         if not use_auto:
             args += ["--language", lang]
         _run(args)
-        txt_path = out_dir / (Path(path).stem + ".txt")
+        stem = os.path.splitext(os.path.basename(path))[0]
+        txt_path = os.path.join(out_dir, stem + ".txt")
     else:
         # whisper.cpp style
         if not model_path:
             raise RuntimeError("whisper.cpp requires --whisper-model-path to a ggml*.bin file")
-        args = [whisper_cmd, "-m", model_path, "-f", path, "-otxt", "-of", str(base)]
+        args = [whisper_path, "-m", model_path, "-f", path, "-otxt", "-of", base]
         if use_auto:
             args += ["-l", "auto"]
         else:
             args += ["-l", lang]
         _run(args)
-        txt_path = Path(str(base) + ".txt")
+        txt_path = base + ".txt"
 
-    if not txt_path.exists():
-        raise RuntimeError(f"Transcript file not found: {txt_path}")
-    return txt_path.read_text(encoding="utf-8").strip(), txt_path
+    try:
+        with open(txt_path, encoding="utf-8") as handle:
+            text = handle.read().strip()
+    except FileNotFoundError:
+        raise RuntimeError(f"Transcript file not found: {txt_path}") from None
+    return text, Path(txt_path)
+
+def _feed_stdin(pipe, data: bytes) -> None:
+    """Write `data` to a child's stdin and close it (runs on a helper thread)."""
+    try:
+        pipe.write(data)
+    except BrokenPipeError:
+        pass
+    finally:
+        try:
+            pipe.close()
+        except OSError:
+            pass
 
-def call_codex_auto(prompt: str, codex_cmd: str, *, timeout: int | None = None) -> str | None:
-    """Invoke the Codex CLI and gracefully fallback across invocation modes.
+def _run_streaming(argv, sink, *, input_bytes=None, timeout=None, env=None) -> int:
+    """Execute a command like `_run`, forwarding stdout to `sink` as it arrives.
 
-    The function first tries to run Codex in "argument mode" (passing the prompt
-    as a positional argument) and, if that fails, switches to piping the prompt
-    via stdin. When Codex refuses to run without a TTY we emulate one using a
-    pseudo-terminal so the same behavior works inside scripts and tests. Any
-    extra Codex flags supplied via `--codex-args` are threaded through every
-    attempt.
+    stderr goes to an unnamed temp file so it can never back up the pipe
+    while stdout is being forwarded, and is only read when reporting errors.
+    stdin is fed from a helper thread (as `communicate` does) so a large
+    prompt cannot deadlock against a full stdout pipe. The child is killed if
+    anything goes wrong before it has exited.
 
     Returns:
-        Either the captured stdout text (when running in a non-interactive
-        environment) or None if Codex wrote directly to the parent TTY.
+        The number of stdout bytes written to `sink`.
+
+    Raises:
+        RuntimeError: if the command times out or exits non-zero.
+    """
+    executable = argv[0]
+    if not os.path.dirname(executable):
+        executable = _resolve(executable)
+    forwarded = 0
+    with tempfile.TemporaryFile() as err_file:
+        def _timeout_error():
+            err_file.seek(0)
+            return RuntimeError(f"Timeout running: {' '.join(argv)}\n{err_file.read().decode(errors='ignore')}")
+
+        p = subprocess.Popen([executable, *argv[1:]], stdin=subprocess.PIPE if input_bytes else None,
+                             stdout=subprocess.PIPE, stderr=err_file, env=env, close_fds=False)
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        writer = None
+        try:
+            if input_bytes:
+                writer = threading.Thread(target=_feed_stdin, args=(p.stdin, input_bytes), daemon=True)
+                writer.start()
+            out_fd = p.stdout.fileno()
+            while True:
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0 or not select.select([out_fd], [], [], remaining)[0]:
+                        raise _timeout_error()
+                chunk = os.read(out_fd, 65536)
+                if not chunk:
+                    break
+                sink.write(chunk)
+                sink.flush()
+                forwarded += len(chunk)
+            try:
+                p.wait(timeout=None if deadline is None else max(0.0, deadline - time.monotonic()))
+            except subprocess.TimeoutExpired:
+                raise _timeout_error() from None
+        except BaseException:
+            p.kill()
+            p.wait()
+            raise
+        finally:
+            p.stdout.close()
+            if writer is not None:
+                writer.join()
+        if p.returncode != 0:
+            err_file.seek(0)
+            raise RuntimeError(f"Nonzero exit {p.returncode}: {' '.join(argv)}\n{err_file.read().decode(errors='ignore')}")
+    return forwarded
+
+def _invoke_codex(prompt: str, codex_cmd: str, *, timeout: int | None, sink=None, direct_tty: bool = True):
+    """Shared attempt loop behind `call_codex_auto` and `call_codex_auto_stream`.
+
+    Returns:
+        None when Codex wrote directly to the parent TTY, the captured stdout
+        bytes when `sink` is None, or the number of bytes forwarded to `sink`.
     """
-    _require(codex_cmd)
+    global _LAST_GOOD_CODEX_MODE
+    # Spawn the resolved path so neither _run nor the child searches PATH again.
+    codex_cmd = _require(codex_cmd)
     prompt_bytes = prompt.encode("utf-8")
     error_messages: list[str] = []
 
     # Allow higher-level wrappers (like the Rust TUI) to inject extra Codex CLI flags.
-    extra_args = list(_EXTRA_CODEX_ARGS)
-    env = os.environ.copy()
-    env.setdefault("TERM", env.get("TERM", "xterm-256color"))
+    extra_args = _EXTRA_CODEX_ARGS
+    env = _codex_env()
 
-    if sys.stdout.isatty():
+    if direct_tty and sys.stdout.isatty():
         # Fast path: when the parent is an interactive shell prefer streaming output
         # directly so Codex can render progress/UI elements untouched.
         cmd1 = [codex_cmd, *extra_args, prompt]
@@ -273,27 +594,96 @@ def call_codex_auto(prompt: str, codex_cmd: str, *, timeout: int | None = None)
             f"Stdin mode exit {result.returncode}: {' '.join(cmd2)}\n{(result.stderr or '').strip()}"
         )
 
-    attempts = [
-        ([codex_cmd, *extra_args, prompt], {}),
-        ([codex_cmd, *extra_args], {"input_bytes": prompt_bytes}),
-    ]
-
-    for argv, extra in attempts:
-        try:
+    attempts = {
+        "arg": ([codex_cmd, *extra_args, prompt], {}),
+        "stdin": ([codex_cmd, *extra_args], {"input_bytes": prompt_bytes}),
+    }
+
+    cached = _LAST_GOOD_CODEX_MODE
+
+    def _attempt(mode: str):
+        # Only the known-good mode streams; probing attempts are buffered and
+        # flushed to `sink` on success, so a failed probe's output (which the
+        # non-stream path also discards) never reaches the sink.
+        global _LAST_GOOD_CODEX_MODE
+        base, _, pty_suffix = mode.partition("_")
+        argv, extra = attempts[base]
+        stream_to = sink if mode == cached else None
+        if pty_suffix:
+            out = _run_with_pty(argv, timeout=timeout, env=env, sink=stream_to, **extra)
+        elif stream_to is None:
             out = _run(argv, timeout=timeout, env=env, **extra)
-            return out.decode("utf-8", errors="ignore")
-        except RuntimeError as exc:
-            error_messages.append(str(exc))
-            if _is_tty_error(exc) and platform.system() != "Windows":
-                try:
-                    out = _run_with_pty(argv, timeout=timeout, env=env, **extra)
-                    return out.decode("utf-8", errors="ignore")
-                except Exception as pty_exc:
-                    error_messages.append(f"PTY fallback failed: {pty_exc}")
+        else:
+            out = _run_streaming(argv, stream_to, timeout=timeout, env=env, **extra)
+        _LAST_GOOD_CODEX_MODE = mode
+        if sink is not None and stream_to is None:
+            sink.write(out)
+            sink.flush()
+            out = len(out)
+        return out
+
+    cached_tty_error = False
+    if cached is not None:
+        try:
+            return _attempt(cached)
+        except Exception as exc:
+            error_messages.append(f"Cached {cached} mode failed: {exc}")
+            cached_tty_error = isinstance(exc, RuntimeError) and _is_tty_error(exc)
+            _LAST_GOOD_CODEX_MODE = None
+
+    for base in ("arg", "stdin"):
+        if base == cached:
+            needs_pty = cached_tty_error
+        else:
+            try:
+                return _attempt(base)
+            except RuntimeError as exc:
+                error_messages.append(str(exc))
+                needs_pty = _is_tty_error(exc)
+        if needs_pty and platform.system() != "Windows" and f"{base}_pty" != cached:
+            try:
+                return _attempt(f"{base}_pty")
+            except Exception as pty_exc:
+                error_messages.append(f"PTY fallback failed: {pty_exc}")
 
     joined = "\n---\n".join(error_messages)
     raise RuntimeError(f"Codex invocation failed:\n{joined}")
 
+def call_codex_auto(prompt: str, codex_cmd: str, *, timeout: int | None = None) -> str | None:
+    """Invoke the Codex CLI and gracefully fallback across invocation modes.
+
+    The function first tries to run Codex in "argument mode" (passing the prompt
+    as a positional argument) and, if that fails, switches to piping the prompt
+    via stdin. When Codex refuses to run without a TTY we emulate one using a
+    pseudo-terminal so the same behavior works inside scripts and tests. Any
+    extra Codex flags supplied via `--codex-args` are threaded through every
+    attempt.
+
+    Returns:
+        Either the captured stdout text (when running in a non-interactive
+        environment) or None if Codex wrote directly to the parent TTY.
+    """
+    out = _invoke_codex(prompt, codex_cmd, timeout=timeout)
+    return None if out is None else out.decode("utf-8", errors="ignore")
+
+def call_codex_auto_stream(prompt: str, codex_cmd: str, *, timeout: int | None = None, sink=None) -> int | None:
+    """Invoke Codex like `call_codex_auto`, streaming its output instead of buffering.
+
+    Once an invocation mode is known to work, output is written to `sink`
+    (default `sys.stdout.buffer`) as it arrives. While modes are still being
+    probed each attempt is buffered and only a successful one reaches `sink`,
+    so failed attempts never leak partial output. The direct-TTY fast path
+    stays enabled when writing to the default stdout sink.
+
+    Returns:
+        The number of bytes forwarded, or None if Codex wrote directly to the
+        parent TTY.
+    """
+    direct_tty = sink is None
+    if sink is None:
+        sink = sys.stdout.buffer
+    return _invoke_codex(prompt, codex_cmd, timeout=timeout, sink=sink, direct_tty=direct_tty)
+
 
 @dataclass
 class PipelineConfig:
@@ -374,30 +764,55 @@ def _prepare_tmp_dir(keep_audio: bool) -> tuple[Path, bool, Callable[[], None]]:
     return path, False, _cleanup
 
 
+def _prefetch_model(model_path: str | None) -> None:
+    """Ask the kernel to start reading a whisper.cpp model into the page cache.
+
+    `posix_fadvise(WILLNEED)` returns immediately and readahead runs in the
+    background, so a cold model load overlaps with the ffmpeg recording
+    instead of following it. Best effort: failures are ignored.
+    """
+    if not model_path or not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(model_path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
 def capture_transcript(config: PipelineConfig) -> CaptureArtifacts:
     """Record and transcribe audio according to `config`, returning artifacts."""
+    # Resolve Whisper before recording so a missing binary fails without the capture delay.
+    _require(config.whisper_cmd)
+    _prefetch_model(config.whisper_model_path)
     tmp_dir, retained, cleanup_cb = _prepare_tmp_dir(config.keep_audio)
     try:
-        wav = tmp_dir / "audio.wav"
-        t0 = time.monotonic()
-        record_wav(str(wav), config.seconds, config.ffmpeg_cmd, config.ffmpeg_device)
-        t1 = time.monotonic()
+        wav = os.path.join(tmp_dir, "audio.wav")
+        # Integer nanosecond stamps; convert to seconds once when building metrics.
+        t0 = time.monotonic_ns()
+        record_wav(wav, config.seconds, config.ffmpeg_cmd, config.ffmpeg_device)
+        t1 = time.monotonic_ns()
         transcript_text, transcript_path = transcribe(
-            str(wav),
+            wav,
             config.whisper_cmd,
             config.lang,
             config.whisper_model,
             model_path=config.whisper_model_path,
             tmpdir=tmp_dir,
         )
-        t2 = time.monotonic()
+        t2 = time.monotonic_ns()
         metrics = {
-            "record_s": round(t1 - t0, 3),
-            "stt_s": round(t2 - t1, 3),
+            "record_s": round((t1 - t0) / 1e9, 3),
+            "stt_s": round((t2 - t1) / 1e9, 3),
         }
         return CaptureArtifacts(
             transcript=transcript_text,
-            wav_path=wav,
+            wav_path=Path(wav),
             transcript_path=transcript_path,
             metrics=metrics,
             tmp_dir=tmp_dir,
@@ -409,17 +824,26 @@ def capture_transcript(config: PipelineConfig) -> CaptureArtifacts:
         raise
 
 
-def finalize_pipeline(artifacts: CaptureArtifacts, config: PipelineConfig, prompt_override: str | None = None) -> PipelineResult:
-    """Send the chosen prompt to Codex (when enabled) and build a result."""
+def finalize_pipeline(artifacts: CaptureArtifacts, config: PipelineConfig, prompt_override: str | None = None, *, stream: bool = False) -> PipelineResult:
+    """Send the chosen prompt to Codex (when enabled) and build a result.
+
+    With `stream=True` Codex output goes straight to stdout as it arrives;
+    `codex_output` stays None and only the byte count is kept in metrics.
+    """
     prompt = prompt_override if prompt_override is not None else artifacts.transcript
     metrics = dict(artifacts.metrics)
     codex_out: str | None = None
-    codex_duration = 0.0
+    codex_ns = 0
     if config.run_codex and prompt:
-        codex_start = time.monotonic()
-        codex_out = call_codex_auto(prompt, config.codex_cmd, timeout=config.codex_timeout)
-        codex_duration = time.monotonic() - codex_start
-    metrics["codex_s"] = round(codex_duration, 3)
+        codex_start = time.monotonic_ns()
+        if stream:
+            streamed = call_codex_auto_stream(prompt, config.codex_cmd, timeout=config.codex_timeout)
+            if streamed is not None:
+                metrics["codex_bytes"] = streamed
+        else:
+            codex_out = call_codex_auto(prompt, config.codex_cmd, timeout=config.codex_timeout)
+        codex_ns = time.monotonic_ns() - codex_start
+    metrics["codex_s"] = round(codex_ns / 1e9, 3)
     metrics["total_s"] = round(metrics["record_s"] + metrics["stt_s"] + metrics["codex_s"], 3)
     audio_path = str(artifacts.wav_path) if artifacts.artifacts_retained else None
     transcript_path = str(artifacts.transcript_path) if artifacts.artifacts_retained and artifacts.transcript_path else None
@@ -475,11 +899,10 @@ def main():
 
     global _EXTRA_CODEX_ARGS
     # Persist additional Codex flags so helper functions can reuse them.
-    _EXTRA_CODEX_ARGS = []
-    if getattr(args, "codex_args", None):
-        _EXTRA_CODEX_ARGS.extend(shlex.split(args.codex_args))
-    if getattr(args, "codex_arg", None):
-        _EXTRA_CODEX_ARGS.extend(args.codex_arg)
+    _EXTRA_CODEX_ARGS = (
+        *shlex.split(getattr(args, "codex_args", None) or ""),
+        *(getattr(args, "codex_arg", None) or ()),
+    )
 
     config = PipelineConfig(
         seconds=args.seconds,
@@ -501,7 +924,10 @@ def main():
         if not args.emit_json:
             _print_human_summary(result)
         else:
-            print(json.dumps(result.to_dict(), ensure_ascii=False))
+            if orjson is not None:
+                print(orjson.dumps(result.to_dict()).decode("utf-8"))
+            else:
+                print(json.dumps(result.to_dict(), ensure_ascii=False))
         return
 
     # Interactive flow: capture once, allow manual edits, then send.
@@ -519,9 +945,7 @@ def main():
             print("\n[Codex output]")
             sys.stdout.flush()
 
-        result = finalize_pipeline(artifacts, config, prompt_override=prompt)
-        if config.run_codex and result.codex_output is not None:
-            print(result.codex_output)
+        result = finalize_pipeline(artifacts, config, prompt_override=prompt, stream=True)
         _print_human_summary(result, repeat_transcript=False, include_buffer=False)
     finally:
         artifacts.cleanup()
@@ -0,0 +1,247 @@
+"""Tests for the python_fallback PTY runner, cursor-query filter, and Codex mode fallback."""
+
+import io
+import platform
+import sys
+import time
+import unittest
+from unittest import mock
+
+from scripts import python_fallback
+
+PY = sys.executable
+
+
+class CursorReportFilterTests(unittest.TestCase):
+    """Validate ESC[6n stripping across PTY read boundaries."""
+
+    def test_query_removed_at_every_split_point(self) -> None:
+        stream = b"pre\x1b[6npost"
+        for split in range(len(stream) + 1):
+            with self.subTest(split=split):
+                report_filter = python_fallback._CursorReportFilter()
+                out = bytearray()
+
+                found = report_filter.feed(stream[:split], out)
+                found += report_filter.feed(stream[split:], out)
+
+                self.assertEqual(bytes(out), b"prepost")
+                self.assertEqual(found, 1)
+                self.assertEqual(report_filter.state, 0)
+
+    def test_query_fed_one_byte_at_a_time(self) -> None:
+        report_filter = python_fallback._CursorReportFilter()
+        out = bytearray()
+        found = 0
+
+        for byte in b"a\x1b[6nb\x1b[6n":
+            found += report_filter.feed(bytes([byte]), out)
+
+        self.assertEqual(bytes(out), b"ab")
+        self.assertEqual(found, 2)
+
+    def test_broken_query_prefix_is_kept(self) -> None:
+        report_filter = python_fallback._CursorReportFilter()
+        out = bytearray()
+
+        found = report_filter.feed(b"x\x1b[", out)
+        found += report_filter.feed(b"1mred", out)
+
+        self.assertEqual(bytes(out), b"x\x1b[1mred")
+        self.assertEqual(found, 0)
+
+    def test_size_limits_reused_buffer(self) -> None:
+        report_filter = python_fallback._CursorReportFilter()
+        out = bytearray()
+        buffer = bytearray(b"ok\x1b[6nstale-bytes")
+
+        found = report_filter.feed(buffer, out, size=6)
+
+        self.assertEqual(bytes(out), b"ok")
+        self.assertEqual(found, 1)
+
+
+@unittest.skipIf(platform.system() == "Windows", "PTY fallback is POSIX-only")
+class RunWithPtyTests(unittest.TestCase):
+    """Exercise the PTY read loop: drain on exit, child-exit wakeups, and the deadline."""
+
+    def test_output_written_just_before_exit_is_drained(self) -> None:
+        out = python_fallback._run_with_pty([PY, "-c", "import sys; sys.stdout.write('x' * 300000)"])
+
+        self.assertEqual(out, b"x" * 300000)
+
+    def test_cursor_query_is_stripped_and_answered(self) -> None:
+        child = (
+            "import os, tty; tty.setraw(0); os.write(1, b'q\\x1b[6n');"
+            "os.write(1, b'|' + os.read(0, 6).replace(b'\\x1b', b'E'))"
+        )
+
+        out = python_fallback._run_with_pty([PY, "-c", child])
+
+        self.assertEqual(out, b"q|E[1;1R")
+
+    def test_input_bytes_get_trailing_newline(self) -> None:
+        out = python_fallback._run_with_pty(["sh", "-c", "read x; echo got $x"], input_bytes=b"ping")
+
+        self.assertTrue(out.endswith(b"got ping\r\n"))
+
+    def test_sink_receives_output_and_count_is_returned(self) -> None:
+        sink = io.BytesIO()
+
+        forwarded = python_fallback._run_with_pty(["sh", "-c", "echo hi"], sink=sink)
+
+        self.assertEqual(sink.getvalue(), b"hi\r\n")
+        self.assertEqual(forwarded, 4)
+
+    def test_deadline_kills_a_hung_child(self) -> None:
+        start = time.monotonic()
+
+        with self.assertRaisesRegex(RuntimeError, "Timeout running"):
+            python_fallback._run_with_pty(["sleep", "10"], timeout=0.3)
+
+        self.assertLess(time.monotonic() - start, 5)
+
+    def test_nonzero_exit_includes_output(self) -> None:
+        with self.assertRaisesRegex(RuntimeError, r"Nonzero exit 3 \(PTY\)[\s\S]*oops"):
+            python_fallback._run_with_pty(["sh", "-c", "echo oops; exit 3"])
+
+    def test_exit_detected_without_pidfd(self) -> None:
+        # pidfd_open failing (kernel < 5.3) leaves the loop on its polling fallback.
+        with mock.patch.object(python_fallback.os, "pidfd_open", side_effect=OSError, create=True):
+            out = python_fallback._run_with_pty(["sh", "-c", "echo done"], timeout=10)
+
+        self.assertEqual(out, b"done\r\n")
+
+
+class InvokeCodexTests(unittest.TestCase):
+    """Validate cached-mode ordering and fallback across Codex invocation modes."""
+
+    def setUp(self) -> None:
+        self.original_mode = python_fallback._LAST_GOOD_CODEX_MODE
+        python_fallback._LAST_GOOD_CODEX_MODE = None
+        self.calls = []
+        self.results = {}
+        patches = [
+            mock.patch.object(python_fallback, "_require", return_value="/bin/codex"),
+            mock.patch.object(python_fallback, "_run", side_effect=self._fake("run")),
+            mock.patch.object(python_fallback, "_run_with_pty", side_effect=self._fake("pty")),
+            mock.patch.object(python_fallback, "_run_streaming", side_effect=self._fake_streaming),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def tearDown(self) -> None:
+        python_fallback._LAST_GOOD_CODEX_MODE = self.original_mode
+
+    @staticmethod
+    def _mode(argv, runner, extra) -> str:
+        base = "stdin" if "input_bytes" in extra else "arg"
+        return f"{base}_pty" if runner == "pty" else base
+
+    def _result_for(self, mode):
+        result = self.results.get(mode, b"ok:" + mode.encode())
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def _fake(self, runner):
+        def run(argv, **extra):
+            sink = extra.pop("sink", None)
+            mode = self._mode(argv, runner, extra)
+            self.calls.append((mode, "stream" if sink is not None else "buffer"))
+            out = self._result_for(mode)
+            if sink is not None:
+                sink.write(out)
+                return len(out)
+            return out
+
+        return run
+
+    def _fake_streaming(self, argv, sink, **extra):
+        mode = self._mode(argv, "stream", extra)
+        self.calls.append((mode, "stream"))
+        sink.write(b"partial-")
+        out = self._result_for(mode)
+        sink.write(out)
+        return len(out) + len(b"partial-")
+
+    def _invoke(self, sink=None):
+        return python_fallback._invoke_codex("hello", "codex", timeout=5, sink=sink, direct_tty=False)
+
+    def test_arg_failure_falls_back_to_stdin_and_is_cached(self) -> None:
+        self.results["arg"] = RuntimeError("Nonzero exit 1: codex")
+
+        out = self._invoke()
+
+        self.assertEqual(out, b"ok:stdin")
+        self.assertEqual([mode for mode, _ in self.calls], ["arg", "stdin"])
+        self.assertEqual(python_fallback._LAST_GOOD_CODEX_MODE, "stdin")
+
+    def test_cached_mode_is_tried_first(self) -> None:
+        python_fallback._LAST_GOOD_CODEX_MODE = "stdin"
+
+        out = self._invoke()
+
+        self.assertEqual(out, b"ok:stdin")
+        self.assertEqual([mode for mode, _ in self.calls], ["stdin"])
+
+    def test_failed_cached_mode_is_cleared_and_others_probed(self) -> None:
+        python_fallback._LAST_GOOD_CODEX_MODE = "stdin"
+        self.results["stdin"] = RuntimeError("Nonzero exit 1: codex")
+
+        out = self._invoke()
+
+        self.assertEqual(out, b"ok:arg")
+        # The cached mode is not retried inside the probe loop.
+        self.assertEqual([mode for mode, _ in self.calls], ["stdin", "arg"])
+        self.assertEqual(python_fallback._LAST_GOOD_CODEX_MODE, "arg")
+
+    def test_tty_error_retries_the_same_mode_under_a_pty(self) -> None:
+        self.results["arg"] = RuntimeError("Error: stdout is not a terminal")
+
+        out = self._invoke()
+
+        self.assertEqual(out, b"ok:arg_pty")
+        self.assertEqual([mode for mode, _ in self.calls], ["arg", "arg_pty"])
+        self.assertEqual(python_fallback._LAST_GOOD_CODEX_MODE, "arg_pty")
+
+    def test_cached_mode_tty_failure_retries_under_pty(self) -> None:
+        python_fallback._LAST_GOOD_CODEX_MODE = "arg"
+        self.results["arg"] = RuntimeError("Error: stdout is not a terminal")
+
+        self._invoke()
+
+        self.assertEqual([mode for mode, _ in self.calls], ["arg", "arg_pty"])
+
+    def test_all_modes_failing_reports_every_attempt(self) -> None:
+        for mode in ("arg", "stdin"):
+            self.results[mode] = RuntimeError(f"{mode} broke")
+
+        with self.assertRaisesRegex(RuntimeError, r"Codex invocation failed:[\s\S]*arg broke[\s\S]*stdin broke"):
+            self._invoke()
+        self.assertIsNone(python_fallback._LAST_GOOD_CODEX_MODE)
+
+    def test_probing_attempts_are_buffered_and_failures_never_reach_sink(self) -> None:
+        self.results["arg"] = RuntimeError("Nonzero exit 1: codex")
+        sink = io.BytesIO()
+
+        forwarded = self._invoke(sink=sink)
+
+        self.assertEqual(sink.getvalue(), b"ok:stdin")
+        self.assertEqual(forwarded, len(b"ok:stdin"))
+        self.assertEqual(self.calls, [("arg", "buffer"), ("stdin", "buffer")])
+
+    def test_cached_mode_streams_to_sink(self) -> None:
+        python_fallback._LAST_GOOD_CODEX_MODE = "stdin"
+        sink = io.BytesIO()
+
+        forwarded = self._invoke(sink=sink)
+
+        self.assertEqual(self.calls, [("stdin", "stream")])
+        self.assertEqual(sink.getvalue(), b"partial-ok:stdin")
+        self.assertEqual(forwarded, len(b"partial-ok:stdin"))
+
+
+if __name__ == "__main__":
+    unittest.main()